@@ -1,11 +1,10 @@
 from collections.abc import Callable
-from dataclasses import dataclass
+from typing import NamedTuple
 
 type AllowedTypes = int | float | complex | str | bool | None
 
 
-@dataclass(init=True, slots=True, frozen=True)
-class SettingsField[T: AllowedTypes]:
+class SettingsField[T: AllowedTypes](NamedTuple):
 	default: T | None = None
 	factory: Callable[[], T] | str | None = None
 	nullable: bool = False
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-import re
+from collections import ChainMap
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
-from os import PathLike, getenv
+from inspect import get_annotations, getattr_static
+from os import PathLike, environ, fspath
+from pathlib import Path
+from string import ascii_uppercase, digits
 from types import NoneType, UnionType
-from typing import Any, get_args
+from typing import Any, ClassVar, get_args
 from warnings import warn
 
 from dotenv import load_dotenv
@@ -13,6 +17,142 @@ from structlog import BoundLogger
 from ..log import get_logger
 from .field import AllowedTypes, SettingsField
 
+_UPPER = frozenset(ascii_uppercase)
+_UPPER_SNAKE = _UPPER | frozenset(digits + "_")
+_ALLOWED_TYPES: frozenset[type] = frozenset(get_args(AllowedTypes.__value__))
+_TRUTHY = frozenset(("yes", "true", "1", "y", "t", "on"))
+_ATTR_FORMAT_ERROR = "AppSettings attributes should contain only capital letters and underscores"
+_DOTENV_LOADED: dict[str | None, float | None] = {}
+
+
+def _load_dotenv_once(dotenv_path: str | PathLike[str] | None) -> None:
+	"""Load a .env file unless the same file (by path and mtime) was already loaded."""
+	key = None if dotenv_path is None else fspath(dotenv_path)
+	try:
+		mtime = None if key is None else Path(key).stat().st_mtime
+	except OSError:
+		mtime = None
+
+	if key in _DOTENV_LOADED and _DOTENV_LOADED[key] == mtime:
+		return
+
+	load_dotenv(dotenv_path=dotenv_path)
+	_DOTENV_LOADED[key] = mtime
+
+
+def _unwrap_type(tp: Any) -> Any:
+	if isinstance(tp, UnionType):
+		args = [a for a in get_args(tp) if a is not NoneType]
+		return args[0] if args else NoneType
+	return tp
+
+
+def _coerce_none(_var: str) -> None:
+	return None
+
+
+def _coerce_bool(_var: str) -> bool:
+	return _var.lower() in _TRUTHY
+
+
+def _coercer_for(annotated: Any) -> tuple[Callable[[str], Any], bool]:
+	"""
+
+	Resolve the callable turning a raw environment string into the annotated type.
+
+	The flag tells whether the coerced value is always an allowed immutable type,
+	in which case it does not need to be validated again.
+
+	"""
+	tp = _unwrap_type(annotated)
+	if tp is NoneType:
+		return _coerce_none, True
+	if tp is bool:
+		return _coerce_bool, True
+	return tp, isinstance(tp, type) and tp in _ALLOWED_TYPES
+
+
+def _is_upper_snake(attr: str) -> bool:
+	return bool(attr) and attr[0] in _UPPER and _UPPER_SNAKE.issuperset(attr)
+
+
+def _fallback_lines(
+	idx: int, attr: str, settings_field: SettingsField, ns: dict[str, Any]
+) -> list[str]:
+	"""Source lines resolving a field that is missing from the environment."""
+	default, factory, nullable = settings_field
+	key = repr(attr)
+
+	if default is not None:
+		ns[f"default_{idx}"] = default
+		# defaults are fixed per class; only ones of a disallowed type need runtime validation
+		value = f"default_{idx}"
+		if type(default) not in _ALLOWED_TYPES:
+			value = f"validate({value}, strict)"
+		return [
+			f"values[{key}] = {value}",
+			f"log.debug('evaluated from default', attr={key})",
+		]
+
+	if factory is not None:
+		if isinstance(factory, str):
+			return [f"log.debug('defer init as factory is a str; => property', attr={key})"]
+
+		if callable(factory):
+			ns[f"factory_{idx}"] = factory
+			return [
+				f"values[{key}] = validate(factory_{idx}(), strict)",
+				f"log.debug('evaluated from factory', attr={key})",
+			]
+
+		ns[f"error_{idx}"] = f"unknown type for a factory: {type(factory)}"
+		return [f"raise TypeError(error_{idx})"]
+
+	if nullable:
+		return [
+			f"values[{key}] = None",
+			f"log.debug('evaluated as None (nullable)', attr={key})",
+		]
+
+	ns[f"error_{idx}"] = f"reqd field {attr} was not found in .env"
+	return [f"raise ValueError(error_{idx})"]
+
+
+def _build_resolver(
+	owner: str,
+	fields: tuple[tuple[str, SettingsField, Callable[[str], Any], bool], ...],
+) -> Callable[[AppSettings, Mapping[str, str], Any, bool], None]:
+	"""
+
+	Generate a straight-line function resolving every field of a settings class.
+
+	Lookups, coercers, defaults and factories are bound once per class, so
+	instantiation does no per-field dispatch on the SettingsField itself.
+
+	"""
+	ns: dict[str, Any] = {}
+	lines = [
+		"def resolve(self, env, log, strict):",
+		"\tvalues = self.__dict__",
+		"\tvalidate = self._validate",
+	]
+
+	for idx, (attr, settings_field, coerce, checked) in enumerate(fields):
+		key = repr(attr)
+		ns[f"coerce_{idx}"] = coerce
+		value = f"coerce_{idx}(raw)" if checked else f"validate(coerce_{idx}(raw), strict)"
+		lines += [
+			f"\traw = env.get({key})",
+			"\tif raw is not None:",
+			f"\t\tvalues[{key}] = {value}",
+			f"\t\tlog.debug('evaluated from environment', attr={key})",
+			"\telse:",
+			*(f"\t\t{line}" for line in _fallback_lines(idx, attr, settings_field, ns)),
+		]
+
+	exec(compile("\n".join(lines), f"<{owner} settings resolver>", "exec"), ns)  # noqa: S102
+	return ns["resolve"]
+
 
 @dataclass
 class AppSettings:
@@ -48,6 +188,43 @@ class AppSettings:
 
 	"""
 
+	_settings_fields: ClassVar[
+		tuple[tuple[str, SettingsField, Callable[[str], Any], bool], ...]
+	] = ()
+	_settings_misnamed: ClassVar[bool] = False
+	_settings_deferred: ClassVar[tuple[tuple[str, str, Callable[[Any], Any] | None], ...]] = ()
+	_settings_resolve: ClassVar[Callable[[AppSettings, Mapping[str, str], Any, bool], None]] = (
+		staticmethod(_build_resolver("AppSettings", ()))
+	)
+
+	def __init_subclass__(cls, **kwargs: Any) -> None:
+		super().__init_subclass__(**kwargs)
+		settings_bases = [base for base in cls.__mro__ if issubclass(base, AppSettings)]
+		cls_annotations = ChainMap(*(get_annotations(base) for base in settings_bases))
+		declared: dict[str, SettingsField] = {}
+		for base in reversed(settings_bases):
+			declared.update(
+				(attr, val) for attr, val in vars(base).items() if isinstance(val, SettingsField)
+			)
+
+		cls._settings_fields = tuple(
+			(attr, val, *_coercer_for(cls_annotations.get(attr, NoneType)))
+			for attr, val in declared.items()
+		)
+		cls._settings_misnamed = not all(_is_upper_snake(attr) for attr, *_ in cls._settings_fields)
+		cls._settings_resolve = staticmethod(
+			_build_resolver(cls.__qualname__, cls._settings_fields)
+		)
+
+		deferred = []
+		for attr, (default, factory, _), *_ in cls._settings_fields:
+			if default is not None or not isinstance(factory, str):
+				continue
+			prop = getattr_static(cls, factory, None)
+			# a missing or non-property factory is reported on instantiation
+			deferred.append((attr, factory, prop.fget if isinstance(prop, property) else None))
+		cls._settings_deferred = tuple(deferred)
+
 	def __init__(
 		self,
 		dotenv_path: str | PathLike[str] | None = None,
@@ -75,108 +252,36 @@ class AppSettings:
 
 		"""
 
-		def unwrap_type(tp: type) -> type:
-			if isinstance(tp, UnionType):
-				args = [a for a in get_args(tp) if a is not NoneType]
-				return args[0] if args else NoneType
-			return tp
-
-		def evaluate_var(_type: type, _var: str) -> Any:
-			_type = unwrap_type(_type)
-			if _type is NoneType:
-				return None
-			if _type is bool:
-				return _var.lower() in ("yes", "true", "1", "y")
-			return _type(_var)
-
-		load_dotenv(dotenv_path=dotenv_path)
+		_load_dotenv_once(dotenv_path)
 
 		self._log = get_logger("utilities.appsettings") if logger is None else logger
-		self._deferred = []
 		self._strict = strict
 
-		cls_annotations = self.__class__.__annotations__
-		cls_dict = self.__class__.__dict__
-
-		settings_fields: dict[str, SettingsField] = {
-			attr: val for attr, val in cls_dict.items() if isinstance(val, SettingsField)
-		}
-
-		for attr, settings_field in settings_fields.items():
-			if explicit_format and not re.fullmatch(r"[A-Z][A-Z0-9_]*", attr):
-				raise AttributeError(
-					"AppSettings attributes should contain only capital letters and underscores"
-				)
-
-			annotated = cls_annotations.get(attr, NoneType)
-			string_value = getenv(attr, None)
-
-			if string_value is None:
-				self._validate_empty_string_value(attr, settings_field)
-				continue
-
-			typed_value = evaluate_var(annotated, string_value)
-
-			setattr(self, attr, self._validate(typed_value, strict=self._strict))
-			self._log.debug("evaluated from environment", attr=attr)
+		if explicit_format and self._settings_misnamed:
+			raise AttributeError(_ATTR_FORMAT_ERROR)
 
+		self._settings_resolve(self, environ, self._log, strict)
 		self.__post_init__()
 
-	def _validate_empty_string_value(self, attr: str, settings_field: SettingsField) -> None:
-		if settings_field.default is not None:
-			setattr(
-				self,
-				attr,
-				self._validate(settings_field.default, strict=self._strict),
-			)
-			self._log.debug("evaluated from default", attr=attr)
-			return
-
-		if settings_field.factory is not None:
-			if isinstance(settings_field.factory, str):
-				self._deferred.append((attr, settings_field.factory))
-				self._log.debug("defer init as factory is a str; => property", attr=attr)
-				return
-
-			if callable(settings_field.factory):
-				setattr(
-					self,
-					attr,
-					self._validate(settings_field.factory(), strict=self._strict),
-				)
-				self._log.debug("evaluated from factory", attr=attr)
-				return
-
-			raise TypeError(f"unknown type for a factory: {type(settings_field.factory)}")
-
-		if settings_field.nullable:
-			setattr(self, attr, None)
-			self._log.debug("evaluated as None (nullable)", attr=attr)
-			return
-
-		raise ValueError(f"reqd field {attr} was not found in .env")
-
 	def __post_init__(self) -> None:
-		for attr, factory in self._deferred:
-			if factory not in self.__class__.__dict__:
-				raise AttributeError(
-					f"property {factory} was not found in {self.__class__.__name__}"
-				)
-			if not isinstance(getattr(self.__class__, factory), property):
+		values = self.__dict__
+		for attr, factory, fget in self._settings_deferred:
+			if attr in values:
+				continue
+			if fget is None:
+				if getattr_static(self.__class__, factory, None) is None:
+					raise AttributeError(
+						f"property {factory} was not found in {self.__class__.__name__}"
+					)
 				raise TypeError(f"method {factory} is not a property")
 			self._log.debug("evaluated from property", attr=attr, factory=factory)
-			setattr(
-				self,
-				attr,
-				self._validate(getattr(self, factory), strict=self._strict),
-			)
+			values[attr] = self._validate(fget(self), strict=self._strict)
 
 	@staticmethod
 	def _validate[T: Any](val: T, strict: bool) -> T | None:
 		typeval = type(val)
-		allowed = get_args(AllowedTypes.__value__)
 
-		if typeval not in allowed:
+		if typeval not in _ALLOWED_TYPES:
 			if strict:
 				raise TypeError(f"{typeval} is not an allowed immutable type")
 			else:
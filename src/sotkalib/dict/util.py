@@ -21,20 +21,16 @@ class mod_dict[K, Val](dict[K, Val]):  # noqa: N801
 		return not_none(self)
 
 
-def _valid_keys[Key, Val](d: dict[Key, Val]) -> set[Key]:
-	return {k for k, v in d.items() if is_set(v)}
-
-
 def _filter[Key, Val](d: dict[Key, Val], f: Callable[[Key, Val], bool]) -> mod_dict[Key, Val]:
 	return mod_dict({k: v for k, v in d.items() if f(k, v)})
 
 
 def valid[Key, Val](d: dict[Key, Val]) -> mod_dict[Key, Val]:
-	return _filter(d, lambda k, _: k in _valid_keys(d))
+	return mod_dict({k: v for k, v in d.items() if is_set(v)})
 
 
 def unset[Key, Val](d: dict[Key, Val]) -> mod_dict[Key, Val]:
-	return _filter(d, lambda k, _: k not in _valid_keys(d))
+	return mod_dict({k: v for k, v in d.items() if not is_set(v)})
 
 
 def not_none[Key, Val](d: dict[Key, Val]) -> mod_dict[Key, Val]:
@@ -1,5 +1,6 @@
 from collections.abc import Sequence
 from enum import StrEnum
+from functools import cache
 from typing import Any, Literal, Self, overload
 
 
@@ -16,6 +17,14 @@ class ValidatorMixin(StrEnum):
 			return val.decode("utf-8") if isinstance(val, (bytes, bytearray)) else val
 		raise TypeError("value must be str-like")
 
+	@classmethod
+	def _lookup(cls, normalized: str) -> Self | None:
+		member = cls._value2member_map_.get(normalized)
+		if member is None:
+			# honour custom _missing_ hooks without going through cls() and its ValueError
+			member = cls._missing_(normalized)
+		return member if isinstance(member, cls) else None
+
 	@overload
 	@classmethod
 	def validate(cls, *, val: Any, req: Literal[False] = False) -> Self | None: ...
@@ -31,10 +40,10 @@ class ValidatorMixin(StrEnum):
 				raise ValueError("value is None and req=True")
 			return None
 		normalized = cls._normalize_value(val)
-		try:
-			return cls(normalized)
-		except ValueError as e:
-			raise TypeError(f"{normalized=} not valid: {e}") from e
+		member = cls._lookup(normalized)
+		if member is None:
+			raise TypeError(f"{normalized=} not valid: not a {cls.__name__} value")
+		return member
 
 	@overload
 	@classmethod
@@ -46,10 +55,14 @@ class ValidatorMixin(StrEnum):
 
 	@classmethod
 	def get(cls, val: Any, default: Self | None = None) -> Self | None:
+		if val is None:
+			return default
 		try:
-			return cls.validate(val=val, req=False) or default
-		except (ValueError, TypeError):
+			normalized = cls._normalize_value(val)
+		except TypeError:
 			return default
+		member = cls._lookup(normalized)
+		return default if member is None else member
 
 	def in_(self, *enum_values: Self) -> bool:
 		return self in enum_values
@@ -60,18 +73,24 @@ class ValidatorMixin(StrEnum):
 
 
 class ValuesMixin(StrEnum):
+	@classmethod
+	@cache
+	def _public_members(cls) -> tuple[Self, ...]:
+		# enum members are fixed once the class is created, so the scan is done once per class
+		return tuple(k for k in cls if not k.startswith("_") and isinstance(k.value, str))
+
 	@classmethod
 	def values_list(cls) -> list[str]:
-		return [cls[k] for k in cls.names_list()]
+		return list(cls._public_members())
 
 	@classmethod
 	def values_set(cls) -> set[str]:
-		return {cls[k] for k in cls.names_set()}
+		return set(cls._public_members())
 
 	@classmethod
 	def names_list(cls) -> list[str]:
-		return [k.name for k in cls if not k.startswith("_") and isinstance(k.value, str)]
+		return [k.name for k in cls._public_members()]
 
 	@classmethod
 	def names_set(cls) -> set[str]:
-		return {k.name for k in cls if not k.startswith("_") and isinstance(k.value, str)}
+		return {k.name for k in cls._public_members()}
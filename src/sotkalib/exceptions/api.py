@@ -1,7 +1,9 @@
 import http
 from collections.abc import Mapping
+from functools import cached_property
 from typing import Any
 
+import orjson
 from pydantic import BaseModel
 
 
@@ -49,10 +51,14 @@ class APIError(BaseHTTPError):
 		self.desc = desc
 		self.ctx = ctx
 
-		self.schema = ErrorSchema(
-			code=self.code,
-			desc=self.desc,
-			ctx=self.ctx,
-		)
+		try:
+			detail = orjson.dumps({"code": code, "desc": desc, "ctx": ctx}).decode()
+		except TypeError:
+			# ctx holds something orjson can't encode natively, let pydantic coerce it
+			detail = self.schema.model_dump_json()
 
-		super().__init__(status_code=self.status.value, detail=self.schema.model_dump_json())
+		super().__init__(status_code=self.status.value, detail=detail)
+
+	@cached_property
+	def schema(self) -> ErrorSchema:
+		return ErrorSchema(code=self.code, desc=self.desc, ctx=self.ctx)
@@ -1,17 +1,23 @@
-import inspect
+import sys
 
 
 class ArgsIncludedError(Exception):
 	def __init__(self, *args, stack_depth: int = 2):
 		_args = args
+		frames = []
+		frame = sys._getframe(1)
+		# the outermost (module-level) frame is never included
+		while frame is not None and frame.f_back is not None and len(frames) < stack_depth:
+			frames.append(frame)
+			frame = frame.f_back
+
 		stack_args_to_exc = []
-		frames = inspect.stack()[1:-1][::-1][:stack_depth]
-		for frame_info in frames:
-			frame = frame_info.frame
-			args, _, _, values = inspect.getargvalues(frame)
+		for frame in reversed(frames):
+			code = frame.f_code
 			f_locals = frame.f_locals
-			args_with_values = {arg: values[arg] for arg in args}
-			stack_args_to_exc.append(
-				args_with_values | f_locals | {"frame_name": frame.f_code.co_name}
-			)
+			arg_names = code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+			frame_args = {arg: f_locals[arg] for arg in arg_names if arg in f_locals}
+			frame_args.update(f_locals)
+			frame_args["frame_name"] = code.co_name
+			stack_args_to_exc.append(frame_args)
 		super().__init__(*_args, *stack_args_to_exc)
@@ -1,7 +1,10 @@
+import logging
 from collections.abc import Callable, Coroutine
 from functools import wraps
 from typing import Any
 
+from structlog.stdlib import BoundLogger
+
 from sotkalib.log import get_logger
 
 from .args_incl_error import ArgsIncludedError
@@ -10,13 +13,18 @@ from .args_incl_error import ArgsIncludedError
 def exception_handler[**P, R](
 	func: Callable[P, R],
 	stack_depth: int = 2,
+	logger: BoundLogger | None = None,
 ) -> Callable[P, R]:
+	if logger is None:
+		logger = get_logger()
+
 	@wraps(func)
 	def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
 		try:
 			return func(*args, **kwargs)
 		except Exception as e:
-			get_logger().exception("")
+			if logger.is_enabled_for(logging.ERROR):
+				logger.exception("")
 			raise ArgsIncludedError(*e.args, stack_depth=stack_depth) from e
 
 	return wrapper
@@ -25,13 +33,18 @@ def exception_handler[**P, R](
 def aexception_handler[**P, R](
 	func: Callable[P, Coroutine[Any, Any, R]],
 	stack_depth: int = 2,
+	logger: BoundLogger | None = None,
 ) -> Callable[P, Coroutine[Any, Any, R]]:
+	if logger is None:
+		logger = get_logger()
+
 	@wraps(func)
 	async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
 		try:
 			return await func(*args, **kwargs)
 		except Exception as e:
-			get_logger().exception("")
+			if logger.is_enabled_for(logging.ERROR):
+				logger.exception("")
 			raise ArgsIncludedError(*e.args, stack_depth=stack_depth) from e
 
 	return wrapper
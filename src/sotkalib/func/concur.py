@@ -1,14 +1,23 @@
 import inspect
 from collections.abc import Callable
+from types import FunctionType
 from typing import Any, TypeIs
 
 from sotkalib.type.generics import any_function, async_function
 
 
-def asyncfn[**P, R](fn: any_function[P, R]) -> TypeIs[async_function[P, R]]:
+def _iscoroutinefunction(fn: Callable[..., Any]) -> bool:
+	# plain functions are answered straight from the code flags; partials, bound methods and
+	# functions marked with inspect.markcoroutinefunction go through inspect
+	if type(fn) is FunctionType and "_is_coroutine_marker" not in fn.__dict__:
+		return bool(fn.__code__.co_flags & inspect.CO_COROUTINE)
 	return inspect.iscoroutinefunction(fn)
 
 
+def asyncfn[**P, R](fn: any_function[P, R]) -> TypeIs[async_function[P, R]]:
+	return _iscoroutinefunction(fn)
+
+
 def asyncfn_or_raise(fn: Callable[..., Any]) -> None:
-	if not inspect.iscoroutinefunction(fn):
+	if not _iscoroutinefunction(fn):
 		raise TypeError(f"{fn} is not an async function")
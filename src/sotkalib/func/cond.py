@@ -1,32 +1,44 @@
-from collections.abc import Generator, Sequence
-from contextlib import contextmanager
+from collections.abc import Sequence
+from types import TracebackType
 from typing import Any, Literal, TypeIs
 from warnings import warn
 
 
-@contextmanager
-def suppress(
-	mode: Literal["all", "exact"] = "all",
-	exact_types: Sequence[type[BaseException]] | None = None,
-) -> Generator[None]:
-	if exact_types is None:
-		if mode == "exact":
-			warn(
-				"mode = 'exact' and excts = None is passed to suppress, bubbling exception up",
-				stacklevel=2,
-			)
-		exact_types = ()
-
-	try:
-		yield
-	except Exception as exc:
-		if mode == "all":
-			return
-
-		if mode == "exact" and type(exc) in exact_types:
-			return
-
-		raise exc
+class suppress:  # noqa: N801
+	__slots__ = ("_mode", "_exact_types")
+
+	def __init__(
+		self,
+		mode: Literal["all", "exact"] = "all",
+		exact_types: Sequence[type[BaseException]] | None = None,
+	) -> None:
+		if exact_types is None:
+			if mode == "exact":
+				warn(
+					"mode = 'exact' and excts = None is passed to suppress, bubbling exception up",
+					stacklevel=2,
+				)
+			exact_types = ()
+
+		self._mode = mode
+		self._exact_types = frozenset(exact_types)
+
+	def __enter__(self) -> None:
+		return None
+
+	def __exit__(
+		self,
+		exc_type: type[BaseException] | None,
+		exc_val: BaseException | None,
+		exc_tb: TracebackType | None,
+	) -> bool:
+		if exc_type is None or not issubclass(exc_type, Exception):
+			return False
+
+		if self._mode == "all":
+			return True
+
+		return self._mode == "exact" and exc_type in self._exact_types
 
 
 def or_raise[T](v: T | None, msg: str = "v is None") -> T:
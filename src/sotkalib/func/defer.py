@@ -1,47 +1,80 @@
-from collections.abc import AsyncGenerator, Awaitable, Sequence
-from contextlib import asynccontextmanager
+from collections.abc import Awaitable
+from types import TracebackType
 
 
-async def _await(to_await: Awaitable | Sequence[Awaitable]):
-	if isinstance(to_await, Awaitable):
-		await to_await
+class _Deferred:
+	__slots__ = ("_to_await",)
 
-	else:
-		for a in to_await:
+	def __init__(self, *to_await: Awaitable) -> None:
+		self._to_await = to_await
+
+	async def __aenter__(self) -> None:
+		return None
+
+
+class defer(_Deferred):  # noqa: N801
+	"""Await ``to_await`` on exit, whether or not the body raised."""
+
+	__slots__ = ()
+
+	async def __aexit__(
+		self,
+		exc_type: type[BaseException] | None,
+		exc_val: BaseException | None,
+		exc_tb: TracebackType | None,
+	) -> bool:
+		for a in self._to_await:
 			await a
+		return False
+
+
+class defer_ok(_Deferred):  # noqa: N801
+	"""Await ``to_await`` on exit only if the body did not raise."""
+
+	__slots__ = ()
+
+	async def __aexit__(
+		self,
+		exc_type: type[BaseException] | None,
+		exc_val: BaseException | None,
+		exc_tb: TracebackType | None,
+	) -> bool:
+		if exc_type is None:
+			for a in self._to_await:
+				await a
+		return False
+
+
+class defer_exc(_Deferred):  # noqa: N801
+	"""Await ``to_await`` if the body raised, then re-raise."""
+
+	__slots__ = ()
+
+	async def __aexit__(
+		self,
+		exc_type: type[BaseException] | None,
+		exc_val: BaseException | None,
+		exc_tb: TracebackType | None,
+	) -> bool:
+		if exc_type is not None:
+			for a in self._to_await:
+				await a
+		return False
+
+
+class defer_exc_mute(_Deferred):  # noqa: N801
+	"""Await ``to_await`` if the body raised an ``Exception``, and suppress it."""
 
+	__slots__ = ()
 
-@asynccontextmanager
-async def defer(*to_await: Awaitable) -> AsyncGenerator[None]:
-	try:
-		yield
-	finally:
-		await _await(to_await)
-
-
-@asynccontextmanager
-async def defer_ok(*to_await: Awaitable) -> AsyncGenerator[None]:
-	try:
-		yield
-	except:
-		raise
-	else:
-		await _await(to_await)
-
-
-@asynccontextmanager
-async def defer_exc(*to_await: Awaitable) -> AsyncGenerator[None]:
-	try:
-		yield
-	except:
-		await _await(to_await)
-		raise
-
-
-@asynccontextmanager
-async def defer_exc_mute(*to_await: Awaitable) -> AsyncGenerator[None]:
-	try:
-		yield
-	except Exception as e:
-		_ = e
-		await _await(to_await)
+	async def __aexit__(
+		self,
+		exc_type: type[BaseException] | None,
+		exc_val: BaseException | None,
+		exc_tb: TracebackType | None,
+	) -> bool:
+		if exc_type is not None and issubclass(exc_type, Exception):
+			for a in self._to_await:
+				await a
+			return True
+		return False
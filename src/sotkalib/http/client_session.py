@@ -1,12 +1,16 @@
 import asyncio
+import random
+import socket
 import ssl
 import time
 from collections.abc import Coroutine
+from functools import lru_cache
 from http import HTTPStatus
 from inspect import isawaitable
-from typing import Any, Self
+from typing import Any, Literal, Self
 
 import aiohttp
+from aiohttp.connector import AddrInfoType, SocketFactoryType
 
 from ..log import get_logger
 from .context import (
@@ -14,6 +18,7 @@ from .context import (
 )
 from .models import ClientSettings
 from .types import (
+	ArgumentFunc,
 	Middleware,
 	Next,
 	RanOutOfAttemptsError,
@@ -51,10 +56,61 @@ def _make_ssl_context(disable_tls13: bool = False) -> ssl.SSLContext:
 	return ctx
 
 
+def _socket_factory(options: tuple[tuple[int, int, int], ...]) -> SocketFactoryType:
+	# aiohttp already sets TCP_NODELAY itself; this is for extra options such as SO_KEEPALIVE
+	def factory(addr_info: AddrInfoType) -> socket.socket:
+		family, type_, proto, _, _ = addr_info
+		sock = socket.socket(family=family, type=type_, proto=proto)
+		if family in (socket.AF_INET, socket.AF_INET6):
+			try:
+				for level, optname, value in options:
+					sock.setsockopt(level, optname, value)
+			except OSError:
+				sock.close()
+				raise
+		return sock
+
+	return factory
+
+
+@lru_cache(maxsize=2)
+def _shared_ssl_context(disable_tls13: bool = False) -> ssl.SSLContext:
+	# building a context reads and parses the CA bundles; it is read-only once configured
+	return _make_ssl_context(disable_tls13)
+
+
 class HTTPSession[R = aiohttp.ClientResponse | None]:
+	"""
+	Retrying aiohttp client session.
+
+	Retry and raise rules (``maximum_retries``, ``base``, ``backoff``, ``jitter``,
+	``status_settings`` and ``exception_settings``) are resolved from ``config`` when the
+	session is built; changing them on ``config`` afterwards has no effect, build a new
+	session instead.
+	"""
+
 	config: ClientSettings
 	_session: aiohttp.ClientSession | None
 	_middlewares: list[Middleware[Any, Any]]
+	_pipeline: Next[R]
+	_retry_excs: tuple[type[Exception], ...]
+	_raise_excs: tuple[type[Exception], ...]
+	_raise_unspecified: bool
+	_exc_to_raise: type[Exception] | None
+	_exc_args_func: ArgumentFunc
+	_retry_codes: frozenset[int]
+	_raise_codes: frozenset[int]
+	_status_exc: type[Exception]
+	_status_args_func: ArgumentFunc
+	_not_found_as_none: bool
+	_preview_bytes: int
+	_max_retries: int
+	_base: float
+	_jitter: Literal["none", "full", "decorrelated"]
+	_retry_delays: tuple[float, ...]
+	_static_useragent: str | None
+	_timeout: aiohttp.ClientTimeout
+	_session_kwargs: dict[str, Any]
 	_logger: Any
 
 	def __init__(
@@ -65,6 +121,35 @@ class HTTPSession[R = aiohttp.ClientResponse | None]:
 		self.config = config if config is not None else ClientSettings()
 		self._session = None
 		self._middlewares = _middlewares or []
+		# middlewares are fixed for the lifetime of a session (.use() returns a new one)
+		self._pipeline = self._build_pipeline()
+		exc_settings = self.config.exception_settings
+		self._retry_excs = merge_tuples(exc_settings.to_retry, (StatusRetryError,))
+		self._raise_excs = exc_settings.to_raise
+		self._raise_unspecified = exc_settings.unspecified == "raise"
+		self._exc_to_raise = exc_settings.exc_to_raise
+		self._exc_args_func = exc_settings.args_for_exc_func
+		status_settings = self.config.status_settings
+		self._retry_codes = frozenset(map(int, status_settings.to_retry))
+		self._raise_codes = frozenset(map(int, status_settings.to_raise))
+		self._status_exc = status_settings.exc_to_raise
+		self._status_args_func = status_settings.args_for_exc_func
+		self._not_found_as_none = status_settings.not_found_as_none
+		self._preview_bytes = status_settings.error_body_preview_bytes
+		self._max_retries = self.config.maximum_retries
+		self._base = self.config.base
+		self._jitter = self.config.jitter
+		# one delay per retry, so it must come from the same maximum_retries as the retry count
+		self._retry_delays = _retry_delays(self._base, self.config.backoff, self._max_retries)
+		factory = self.config.useragent_factory
+		self._static_useragent = (
+			factory() if factory is not None and self.config.useragent_static else None
+		)
+		self._timeout = aiohttp.ClientTimeout(total=self.config.timeout)
+		session_kwargs = dict(self.config.session_kwargs)
+		if session_kwargs.get("trust_env") is None:
+			session_kwargs["trust_env"] = False
+		self._session_kwargs = session_kwargs
 		self._logger = get_logger("http.client_session")
 
 	def use[NewR](self, middleware: Middleware[R, NewR]) -> "HTTPSession[NewR]":
@@ -74,18 +159,17 @@ class HTTPSession[R = aiohttp.ClientResponse | None]:
 		)
 
 	async def __aenter__(self) -> Self:
-		ctx = _make_ssl_context(disable_tls13=False)
-
-		session_kwargs = dict(self.config.session_kwargs)
+		session_kwargs = self._session_kwargs
 		if session_kwargs.get("connector") is None:
-			session_kwargs["connector"] = aiohttp.TCPConnector(ssl=ctx)
-		if session_kwargs.get("trust_env") is None:
-			session_kwargs["trust_env"] = False
+			# a connector is closed together with its session, so each open gets a fresh one
+			socket_options = self.config.socket_options
+			connector = aiohttp.TCPConnector(
+				ssl=_shared_ssl_context(),
+				socket_factory=_socket_factory(tuple(socket_options)) if socket_options else None,
+			)
+			session_kwargs = {**session_kwargs, "connector": connector}
 
-		self._session = aiohttp.ClientSession(
-			timeout=aiohttp.ClientTimeout(total=self.config.timeout),
-			**session_kwargs,
-		)
+		self._session = aiohttp.ClientSession(timeout=self._timeout, **session_kwargs)
 
 		self._logger.debug("HTTPSession initialized", timeout=self.config.timeout)
 		return self
@@ -100,14 +184,9 @@ class HTTPSession[R = aiohttp.ClientResponse | None]:
 			await self._session.close()
 
 	def _build_pipeline(self) -> Next[R]:
-		async def core_request(
-			ctx: RequestContext,
-		) -> aiohttp.ClientResponse | None:
-			return await self._execute_request(ctx)
-
-		pipeline: Next[Any] = core_request
+		pipeline: Next[Any] = self._execute_request
 		for middleware in reversed(self._middlewares):
-			pipeline = (lambda mw, nxt: lambda c: mw(c, nxt))(middleware, pipeline)  # noqa: PLC3002
+			pipeline = _bind_middleware(middleware, pipeline)
 
 		return pipeline
 
@@ -115,7 +194,15 @@ class HTTPSession[R = aiohttp.ClientResponse | None]:
 		if self._session is None:
 			raise RuntimeError("HTTPSession must be used as async context manager")
 
-		response = await self._session.request(ctx.method, ctx.url, **ctx.to_request_kwargs())
+		response = await self._session.request(
+			ctx.method,
+			ctx.url,
+			params=ctx.params,
+			headers=ctx.headers,
+			data=ctx.data,
+			json=ctx.json,
+			**ctx.kwargs,
+		)
 		ctx.response = response
 
 		return await self._handle_status(ctx, response)
@@ -126,72 +213,82 @@ class HTTPSession[R = aiohttp.ClientResponse | None]:
 		response: aiohttp.ClientResponse,
 	) -> aiohttp.ClientResponse | None:
 		status = response.status
-		settings = self.config.status_settings
 
 		if self.config.use_cookies_from_response and self._session:
 			self._session.cookie_jar.update_cookies(response.cookies)
 
-		if HTTPStatus(status) in settings.to_retry:
-			text = await response.text()
+		if status in self._retry_codes:
+			# the response is discarded on retry, so only a bounded preview is read and the
+			# connection is handed back right away (closed if the body wasn't drained)
+			text = await _read_body_preview(response, self._preview_bytes)
+			response.release()
 			ctx.response_text = text
 			raise StatusRetryError(status=status, context=text)
 
-		if HTTPStatus(status) in settings.to_raise:
-			exc_cls = settings.exc_to_raise
-			args, kwargs = await await_if_async(settings.args_for_exc_func(ctx))
+		if status in self._raise_codes:
+			exc_cls = self._status_exc
+			args, kwargs = await await_if_async(self._status_args_func(ctx))
 			if kwargs is None:
 				raise exc_cls(*args)
 			raise exc_cls(*args, **kwargs)
 
-		if settings.not_found_as_none and status == HTTPStatus.NOT_FOUND:
+		if status == HTTPStatus.NOT_FOUND and self._not_found_as_none:
 			return None
 
 		return response
 
 	async def _request_with_retry(self, ctx: RequestContext) -> R:
-		ctx.started_at = time.monotonic()
-		ctx.max_attempts = self.config.maximum_retries + 1
+		clock = time.perf_counter_ns
+		ctx.started_at = clock()
+		ctx.max_attempts = self._max_retries + 1
 
-		pipeline = self._build_pipeline()
+		pipeline = self._pipeline
+		retry_excs = self._retry_excs
+		raise_excs = self._raise_excs
 
 		for attempt in range(ctx.max_attempts):
 			ctx.attempt = attempt
-			ctx.attempt_started_at = time.monotonic()
+			ctx.attempt_started_at = clock()
 			ctx.response = None
+			ctx.response_text = None
 
 			try:
 				result = await pipeline(ctx)
-				ctx.finished_at = time.monotonic()
+				ctx.finished_at = clock()
 				return result
 
-			except merge_tuples(self.config.exception_settings.to_retry, (StatusRetryError,)) as e:
-				ctx.errors.append(e)
-				ctx.last_error = e
-				await self._handle_retry(ctx, e)
-
-			except self.config.exception_settings.to_raise as e:
-				ctx.errors.append(e)
-				ctx.last_error = e
-				ctx.finished_at = time.monotonic()
-				await self._handle_to_raise(ctx, e)
-
 			except Exception as e:
 				ctx.errors.append(e)
 				ctx.last_error = e
-				await self._handle_exception(ctx, e)
 
-		ctx.finished_at = time.monotonic()
+				if isinstance(e, retry_excs):
+					await self._handle_retry(ctx, e)
+				elif isinstance(e, raise_excs):
+					ctx.finished_at = clock()
+					await self._handle_to_raise(ctx, e)
+				else:
+					await self._handle_exception(ctx, e)
+
+		ctx.finished_at = clock()
 		raise RanOutOfAttemptsError(
-			f"failed after {self.config.maximum_retries} retries: {type(ctx.last_error).__name__}: {ctx.last_error}"
+			f"failed after {self._max_retries} retries: "
+			f"{type(ctx.last_error).__name__}: {ctx.last_error}"
 		)
 
 	async def _handle_retry(self, ctx: RequestContext, e: Exception) -> None:
-		if ctx.attempt >= self.config.maximum_retries:
+		if ctx.attempt >= self._max_retries:
 			raise RanOutOfAttemptsError(
-				f"failed after {self.config.maximum_retries} retries: {type(e).__name__}: {e}"
+				f"failed after {self._max_retries} retries: {type(e).__name__}: {e}"
 			) from e
 
-		delay = self.config.base * min(MAXIMUM_BACKOFF, self.config.backoff**ctx.attempt)
+		base = self._base
+		delay = _jittered(
+			self._jitter,
+			self._retry_delays[ctx.attempt],
+			base,
+			ctx.last_delay if ctx.last_delay is not None else base,
+		)
+		ctx.last_delay = delay
 		self._logger.debug(
 			"retrying request",
 			attempt=ctx.attempt + 1,
@@ -204,19 +301,17 @@ class HTTPSession[R = aiohttp.ClientResponse | None]:
 		await asyncio.sleep(delay)
 
 	async def _handle_to_raise(self, ctx: RequestContext, e: Exception) -> None:
-		settings = self.config.exception_settings
-
-		exc_cls = settings.exc_to_raise
+		exc_cls = self._exc_to_raise
 		if exc_cls is None:
 			raise e
 
-		args, kwargs = await await_if_async(settings.args_for_exc_func(ctx))
+		args, kwargs = await await_if_async(self._exc_args_func(ctx))
 		if kwargs is None:
 			raise exc_cls(*args) from e
 		raise exc_cls(*args, **kwargs) from e
 
 	async def _handle_exception(self, ctx: RequestContext, e: Exception) -> None:
-		if self.config.exception_settings.unspecified == "raise":
+		if self._raise_unspecified:
 			raise e
 		await self._handle_retry(ctx, e)
 
@@ -230,10 +325,14 @@ class HTTPSession[R = aiohttp.ClientResponse | None]:
 		json: Any = None,
 		**kwargs: Any,
 	) -> RequestContext:
-		if self.config.useragent_factory is not None:
+		useragent = self._static_useragent
+		if useragent is None and self.config.useragent_factory is not None:
+			useragent = self.config.useragent_factory()
+		if useragent is not None:
 			if headers is None:
-				headers = {}
-			headers["User-Agent"] = self.config.useragent_factory()
+				headers = {"User-Agent": useragent}
+			else:
+				headers["User-Agent"] = useragent
 
 		return RequestContext(
 			method=method,
@@ -280,6 +379,49 @@ class HTTPSession[R = aiohttp.ClientResponse | None]:
 		return await self.request("PATCH", url, **kwargs)
 
 
+def _retry_delays(base: float, backoff: float, retries: int) -> tuple[float, ...]:
+	delays: list[float] = []
+	factor = 1.0
+	for attempt in range(retries):
+		# stop exponentiating once capped, so large retry counts can't overflow
+		if factor < MAXIMUM_BACKOFF:
+			factor = min(MAXIMUM_BACKOFF, backoff**attempt)
+		delays.append(base * factor)
+	return tuple(delays)
+
+
+def _jittered(
+	mode: Literal["none", "full", "decorrelated"],
+	delay: float,
+	base: float,
+	previous: float,
+) -> float:
+	# full: uniform between base and the exponential delay; decorrelated: grows off the
+	# previous sleep instead of the attempt number (both keep clients from retrying in lockstep)
+	if mode == "full":
+		return random.uniform(base, delay)  # noqa: S311
+	if mode == "decorrelated":
+		return min(base * MAXIMUM_BACKOFF, random.uniform(base, previous * 3))  # noqa: S311
+	return delay
+
+
+async def _read_body_preview(response: aiohttp.ClientResponse, limit: int) -> str:
+	body = bytearray()
+	while len(body) < limit:
+		chunk = await response.content.read(limit - len(body))
+		if not chunk:
+			break
+		body += chunk
+	return body.decode(response.charset or "utf-8", "replace")
+
+
+def _bind_middleware(middleware: Middleware[Any, Any], nxt: Next[Any]) -> Next[Any]:
+	def handler(ctx: RequestContext) -> Any:
+		return middleware(ctx, nxt)
+
+	return handler
+
+
 def merge_tuples[T](t1: tuple[T, ...], t2: tuple[T, ...]) -> tuple[T, ...]:
 	return t1 + t2
 
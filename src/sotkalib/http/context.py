@@ -5,7 +5,7 @@ from typing import Any
 import aiohttp
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestContext:
 	method: str
 	url: str
@@ -23,9 +23,11 @@ class RequestContext:
 	response_text: str | None = None
 	response_json: Any = None
 
-	started_at: float | None = None
-	finished_at: float | None = None
-	attempt_started_at: float | None = None
+	# time.perf_counter_ns() readings
+	started_at: int | None = None
+	finished_at: int | None = None
+	attempt_started_at: int | None = None
+	last_delay: float | None = None
 
 	errors: list[Exception] = field(default_factory=list)
 	last_error: Exception | None = None
@@ -36,14 +38,14 @@ class RequestContext:
 	def elapsed(self) -> float | None:
 		if self.started_at is None:
 			return None
-		end = self.finished_at if self.finished_at else time.monotonic()
-		return end - self.started_at
+		end = self.finished_at if self.finished_at is not None else time.perf_counter_ns()
+		return (end - self.started_at) / 1e9
 
 	@property
 	def attempt_elapsed(self) -> float | None:
 		if self.attempt_started_at is None:
 			return None
-		return time.monotonic() - self.attempt_started_at
+		return (time.perf_counter_ns() - self.attempt_started_at) / 1e9
 
 	@property
 	def is_retry(self) -> bool:
@@ -59,6 +61,15 @@ class RequestContext:
 		self.headers.update(headers)
 
 	def to_request_kwargs(self) -> dict[str, Any]:
+		if (
+			not self.kwargs
+			and self.params is None
+			and self.headers is None
+			and self.data is None
+			and self.json is None
+		):
+			return {}
+
 		kw = dict(self.kwargs)
 		if self.params is not None:
 			kw["params"] = self.params
@@ -1,5 +1,5 @@
-from collections.abc import Callable
-from copy import deepcopy
+from collections.abc import Callable, Set
+from copy import copy, deepcopy
 from http import HTTPStatus
 from typing import Any, Literal, Self
 from warnings import deprecated
@@ -15,26 +15,47 @@ async def default_stat_arg_func(ctx: RequestContext) -> ArgsKwargs:
 	resp = ctx.response
 	if resp is None:
 		return (), {}
-	return (f"[{resp.status}]; {await resp.text()=}",), {}
+	if ctx.response_text is None:
+		ctx.response_text = await resp.text()
+	return (f"[{resp.status}]; {ctx.response_text=}",), {}
 
 
 async def default_exc_arg_func(ctx: RequestContext) -> ArgsKwargs:
 	return (
 		f"exception {type(ctx.last_error)}: ({ctx.last_error=}) attempt={ctx.attempt}; url={ctx.url}"
-		f" method={ctx.method}"
+		f" method={ctx.method}",
 	), {}
 
 
 class _MergeableSettings(BaseModel):
+	def _field_values(self, skip: Set[str] = frozenset()) -> dict[str, Any]:
+		# shallow per field: nested settings and mutable containers get their own copy, while
+		# exception types, callables and connector-like values are shared as-is
+		values: dict[str, Any] = {}
+		for field_name, value in self.__dict__.items():
+			if field_name in skip:
+				continue
+			if isinstance(value, _MergeableSettings):
+				values[field_name] = value._clone()
+			elif isinstance(value, (set, dict, list)):
+				values[field_name] = copy(value)
+			else:
+				values[field_name] = value
+		return values
+
+	def _clone(self) -> Self:
+		return self.model_construct(_fields_set=set(self.model_fields_set), **self._field_values())
+
 	def _merge_from(self, other: "_MergeableSettings") -> Self:
-		merged = self.model_copy(deep=True)
-		for field_name in other.model_fields_set:
+		overridden = other.model_fields_set
+		values = self._field_values(skip=overridden)
+		for field_name in overridden:
 			value = getattr(other, field_name)
-			base_value = getattr(merged, field_name)
+			base_value = getattr(self, field_name)
 			if isinstance(base_value, _MergeableSettings) and isinstance(value, _MergeableSettings):
 				value = base_value._merge_from(value)
-			object.__setattr__(merged, field_name, value)
-		return merged
+			values[field_name] = value
+		return self.model_construct(_fields_set=self.model_fields_set | overridden, **values)
 
 	def __or__(self, other: "_MergeableSettings") -> Self:
 		if isinstance(other, type(self)):
@@ -49,6 +70,7 @@ class StatusSettings(_MergeableSettings):
 	to_retry: set[HTTPStatus] = Field(default={HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.FORBIDDEN})
 	exc_to_raise: type[Exception] = Field(default=CriticalStatusError)
 	not_found_as_none: bool = Field(default=True)
+	error_body_preview_bytes: int = Field(default=8192, gt=0)
 	args_for_exc_func: ArgumentFunc = Field(default=default_stat_arg_func)
 	unspecified: Literal["retry", "raise"] = Field(default="retry")
 
@@ -84,13 +106,16 @@ class ClientSettings(_MergeableSettings):
 	base: float = Field(default=1.0, gt=0)
 	backoff: float = Field(default=2.0, gt=0)
 	maximum_retries: int = Field(default=3, ge=1)
+	jitter: Literal["none", "full", "decorrelated"] = Field(default="full")
 
 	useragent_factory: Callable[[], str] | None = Field(default=None)
+	useragent_static: bool = Field(default=False)
 
 	status_settings: StatusSettings = Field(default_factory=StatusSettings)
 	exception_settings: ExceptionSettings = Field(default_factory=ExceptionSettings)
 
 	session_kwargs: dict[str, Any] = Field(default_factory=dict)
+	socket_options: list[tuple[int, int, int]] = Field(default_factory=list)
 	use_cookies_from_response: bool = Field(default=False)
 
 	_nested_map: dict[type, str] = {
@@ -104,7 +129,7 @@ class ClientSettings(_MergeableSettings):
 
 		field_name = self._nested_map.get(type(other))
 		if field_name is not None:
-			merged = self.model_copy(deep=True)
+			merged = self._clone()
 			setattr(
 				merged,
 				field_name,
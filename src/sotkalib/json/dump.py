@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
@@ -10,42 +11,78 @@ from sotkalib.func import suppress
 from sotkalib.log import get_logger
 
 
+def _walk_dict(obj: dict, depth: int, limit: int) -> dict:
+	return {k: safe_serialize_value(v, depth + 1, limit) for k, v in obj.items()}
+
+
+def _walk_iter(obj: Any, depth: int, limit: int) -> list:
+	return [safe_serialize_value(item, depth + 1, limit) for item in obj]
+
+
+def _same(obj: Any, _depth: int, _limit: int) -> Any:
+	return obj
+
+
+def _isoformat(obj: date, _depth: int, _limit: int) -> str:
+	return obj.isoformat()
+
+
+def _to_float(obj: Decimal, _depth: int, _limit: int) -> float:
+	return float(obj)
+
+
+def _to_str(obj: UUID, _depth: int, _limit: int) -> str:
+	return str(obj)
+
+
+def _enum_value(obj: Enum, _depth: int, _limit: int) -> Any:
+	return obj.value
+
+
+def _decode(obj: bytes, _depth: int, _limit: int) -> str:
+	return obj.decode("utf-8", errors="replace")
+
+
+type _Handler = Callable[[Any, int, int], Any]
+
+# checked in order for subclasses; exact instances of these types hit _BY_TYPE directly
+_BY_BASE: tuple[tuple[type | tuple[type, ...], _Handler], ...] = (
+	((type(None), str, int, float, bool), _same),
+	((datetime, date), _isoformat),
+	(Decimal, _to_float),
+	(UUID, _to_str),
+	(Enum, _enum_value),
+	(bytes, _decode),
+	(dict, _walk_dict),
+	((list, tuple, set, frozenset), _walk_iter),
+)
+
+_BY_TYPE: dict[type, _Handler] = {
+	tp: handler
+	for bases, handler in _BY_BASE
+	for tp in (bases if isinstance(bases, tuple) else (bases,))
+}
+
+
 def safe_serialize_value(obj: Any, _depth: int = 0, _depth_limit: int = 10) -> Any:
 	if _depth > _depth_limit:
 		return str(obj)
 
-	if obj is None or isinstance(obj, (str, int, float, bool)):
-		return obj
-
-	if isinstance(obj, (datetime, date)):
-		return obj.isoformat()
-	if isinstance(obj, Decimal):
-		return float(obj)
-	if isinstance(obj, UUID):
-		return str(obj)
-	if isinstance(obj, Enum):
-		return obj.value
-	if isinstance(obj, bytes):
-		return obj.decode("utf-8", errors="replace")
+	handler = _BY_TYPE.get(type(obj))
+	if handler is not None:
+		return handler(obj, _depth, _depth_limit)
 
-	if isinstance(obj, dict):
-		return {k: safe_serialize_value(v, _depth + 1, _depth_limit) for k, v in obj.items()}
-	if isinstance(obj, (list, tuple, set, frozenset)):
-		return [safe_serialize_value(item, _depth + 1, _depth_limit) for item in obj]
+	for bases, handler in _BY_BASE:
+		if isinstance(obj, bases):
+			return handler(obj, _depth, _depth_limit)
 
 	if hasattr(obj, "model_dump"):
 		with suppress("exact", (TypeError, ValueError)):
-			return {
-				k: safe_serialize_value(v, _depth + 1, _depth_limit)
-				for k, v in obj.model_dump().items()
-			}
+			return _walk_dict(obj.model_dump(), _depth, _depth_limit)
 
 	if hasattr(obj, "__dict__"):
 		with suppress("exact", (TypeError, ValueError)):
-			return {
-				k: safe_serialize_value(v, _depth + 1, _depth_limit)
-				for k, v in obj.__dict__.items()
-			}
+			return _walk_dict(obj.__dict__, _depth, _depth_limit)
 
 	try:
 		orjson.dumps(obj)
@@ -58,9 +95,33 @@ def safe_serialize_value(obj: Any, _depth: int = 0, _depth_limit: int = 10) -> A
 	return None
 
 
+def _default(obj: Any) -> Any:
+	# leaf hook for orjson; containers, datetimes, enums, UUIDs and dataclasses are native
+	if isinstance(obj, Decimal):
+		return float(obj)
+	if isinstance(obj, bytes):
+		return obj.decode("utf-8", errors="replace")
+	# orjson only takes exact tuples; namedtuples and other subclasses land here too
+	if isinstance(obj, (set, frozenset, tuple)):
+		return list(obj)
+
+	if hasattr(obj, "model_dump"):
+		with suppress("exact", (TypeError, ValueError)):
+			return obj.model_dump()
+
+	if hasattr(obj, "__dict__"):
+		return obj.__dict__
+
+	return str(obj)
+
+
 def safe_serialize(data: Any) -> bytes:
 	try:
-		return orjson.dumps(safe_serialize_value(data))
+		try:
+			return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+		except orjson.JSONEncodeError:
+			# too deep or self-referencing: fall back to the depth-limited python walk
+			return orjson.dumps(safe_serialize_value(data), option=orjson.OPT_NON_STR_KEYS)
 	except BaseException:
 		get_logger().exception("{}", data)
 		raise
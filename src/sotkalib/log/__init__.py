@@ -68,7 +68,12 @@ def configure_logging(
 	_setup_std_logging(settings)
 
 	structlog.configure(
-		processors=[*settings["shared"], ProcessorFormatter.wrap_for_formatter],
+		# drop filtered-out events before timestamping, callsite lookup and exc formatting
+		processors=[
+			structlog.stdlib.filter_by_level,
+			*settings["shared"],
+			ProcessorFormatter.wrap_for_formatter,
+		],
 		wrapper_class=BoundLogger,
 		logger_factory=LoggerFactory(),
 		cache_logger_on_first_use=True,
@@ -97,8 +102,15 @@ def _setup_std_logging(
 SHUT_THE_FUCK_UP_PLEASE_ONG = CRITICAL + 1
 
 
+_LOGGERS: dict[str | None, Any] = {}
+
+
 def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
-	return structlog.get_logger(name)
+	# reusing the proxy lets cache_logger_on_first_use kick in instead of re-binding per call
+	logger = _LOGGERS.get(name)
+	if logger is None:
+		logger = _LOGGERS.setdefault(name, structlog.get_logger(name))
+	return logger
 
 
 def bind_context(**context: Any) -> None:
@@ -1,19 +1,17 @@
 import asyncio
-import os
-from collections.abc import AsyncGenerator, Sequence
-from contextlib import (
-	AbstractAsyncContextManager,
-	asynccontextmanager,
-	suppress,
-)
-from copy import copy
-from time import time
-from typing import Any, Protocol, Self
-
-from pydantic import ConfigDict, Field, SkipValidation
-from pydantic.main import BaseModel
+import hashlib
+import secrets
+import weakref
+from collections.abc import Sequence
+from contextlib import AbstractAsyncContextManager, suppress
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, ClassVar, Protocol, Self
+
 from redis.asyncio import Redis
+from redis.exceptions import NoScriptError
 
+from sotkalib.log import get_logger
 from sotkalib.type.iface import CheckableProtocol, implements
 
 _RELEASE_LUA = """
@@ -24,15 +22,130 @@ else
 end
 """
 
+_ACQUIRE_OR_PTTL_LUA = """
+if redis.call("set", KEYS[1], ARGV[1], "NX", "PX", ARGV[2]) then
+	return {1, 0}
+end
+return {0, redis.call("pttl", KEYS[1])}
+"""
+
 _EXTEND_LUA = """
 if redis.call("get", KEYS[1]) == ARGV[1] then
-	return redis.call("expire", KEYS[1], ARGV[2])
+	return redis.call("pexpire", KEYS[1], ARGV[2])
 else
 	return 0
 end
 """
 
 
+class _Script:
+	__slots__ = ("source", "sha")
+
+	def __init__(self, source: str) -> None:
+		self.source = source
+		self.sha = hashlib.sha1(source.encode()).hexdigest()  # noqa: S324
+
+
+_RELEASE = _Script(_RELEASE_LUA)
+_ACQUIRE_OR_PTTL = _Script(_ACQUIRE_OR_PTTL_LUA)
+_EXTEND = _Script(_EXTEND_LUA)
+
+
+async def _run_script(rc: Redis, script: _Script, key: str, *args: Any) -> Any:
+	# EVALSHA ships only the digest; on a cold script cache EVAL runs it and loads it server-side
+	try:
+		return await rc.evalsha(script.sha, 1, key, *args)  # type: ignore[arg-type]
+	except NoScriptError:
+		return await rc.eval(script.source, 1, key, *args)  # type: ignore[arg-type]
+
+
+class _WatchdogRegistry:
+	"""Extends the TTLs of every lock held through one client with a single pipelined round-trip."""
+
+	__slots__ = ("_rc", "_loop", "_entries", "_wakeup", "_task")
+
+	def __init__(self, rc: Redis) -> None:
+		# weak: the registry is the value of a WeakKeyDictionary keyed by this very client
+		self._rc = weakref.ref(rc)
+		# loop the event and the task below belong to
+		self._loop: weakref.ref[asyncio.AbstractEventLoop] | None = None
+		# (key, token) -> [ttl in ms, interval in s, next deadline]
+		self._entries: dict[tuple[str, str], list[Any]] = {}
+		self._wakeup = asyncio.Event()
+		self._task: asyncio.Task[None] | None = None
+
+	def add(self, key: str, token: str, ttl_ms: int, interval: float) -> None:
+		loop = asyncio.get_running_loop()
+		if self._loop is None or self._loop() is not loop:
+			# a shared client outlives event loops (asyncio.run after asyncio.run): the event
+			# and the task can't cross over, and locks of the old loop have no one to release them
+			self._loop = weakref.ref(loop)
+			self._entries = {}
+			self._wakeup = asyncio.Event()
+			self._task = None
+
+		self._entries[(key, token)] = [ttl_ms, interval, loop.time() + interval]
+		if self._task is None:
+			self._task = loop.create_task(self._run())
+		else:
+			self._wakeup.set()
+
+	def discard(self, key: str, token: str) -> None:
+		self._entries.pop((key, token), None)
+		if not self._entries:
+			# let the idle task notice and exit instead of sleeping out its deadline
+			self._wakeup.set()
+
+	async def _run(self) -> None:
+		try:
+			await self._extend_until_idle()
+		finally:
+			if self._task is asyncio.current_task():
+				self._task = None
+
+	async def _extend_until_idle(self) -> None:
+		loop = asyncio.get_running_loop()
+		entries, wakeup = self._entries, self._wakeup
+		while entries:
+			now = loop.time()
+			nearest = min(entry[2] for entry in entries.values())
+			if nearest > now:
+				wakeup.clear()
+				with suppress(TimeoutError):
+					await asyncio.wait_for(wakeup.wait(), nearest - now)
+				continue
+
+			if (rc := self._rc()) is None:
+				entries.clear()
+				return
+
+			due = [(ident, entry) for ident, entry in entries.items() if entry[2] <= now]
+			try:
+				pipe = rc.pipeline(transaction=False)
+				for (key, token), entry in due:
+					pipe.evalsha(_EXTEND.sha, 1, key, token, entry[0])  # type: ignore[arg-type]
+				results = await pipe.execute(raise_on_error=False)
+				if any(isinstance(r, NoScriptError) for r in results):
+					await rc.script_load(_EXTEND.source)
+					continue
+			except Exception as e:
+				# keep the locks registered and try again on their next tick
+				get_logger("redis.locker").warning(
+					"lock watchdog failed to extend ttls", error=repr(e), locks=len(due)
+				)
+				results = [True] * len(due)
+			finally:
+				# don't keep the client alive while sleeping until the next deadline
+				del rc
+
+			now = loop.time()
+			for (ident, entry), result in zip(due, results, strict=True):
+				if not result or isinstance(result, Exception):
+					entries.pop(ident, None)
+				else:
+					entry[2] = now + entry[1]
+
+
 class strable(CheckableProtocol):  # noqa: N801
 	def __str__(self) -> str: ...
 
@@ -56,18 +169,21 @@ def exponential_delay(base_delay: float, factor: float) -> _backoff:
 _DEFAULT_BACKOFF: _backoff = exponential_delay(0.1, 2)
 
 
-class DLSettings(BaseModel):
-	model_config = ConfigDict(arbitrary_types_allowed=True)
-
+@dataclass(slots=True, kw_only=True)
+class DLSettings:
 	wait: bool = False
-	wait_delay_func: SkipValidation[_backoff] = _DEFAULT_BACKOFF
+	wait_delay_func: _backoff = _DEFAULT_BACKOFF
 	wait_timeout: float = 60.0
 	spin_attempts: int = 0
 
 	retry_if_acquired: bool = False
-	exc_args: SkipValidation[Sequence[Any]] = ()
+	exc_args: Sequence[Any] = ()
 	extend_ttl: bool = True
-	watchdog_factor: float = Field(ge=1, default=3)
+	watchdog_factor: float = 3
+
+	def __post_init__(self) -> None:
+		if self.watchdog_factor < 1:
+			raise ValueError(f"watchdog_factor must be >= 1, got {self.watchdog_factor}")
 
 
 class ContextLockError(Exception):
@@ -90,6 +206,10 @@ class DistributedLock:
 		"_watchdog_factor",
 	)
 
+	_watchdogs: ClassVar[weakref.WeakKeyDictionary[Redis, _WatchdogRegistry]] = (
+		weakref.WeakKeyDictionary()
+	)
+
 	def __init__(
 		self,
 		redis_factory: AbstractAsyncContextManager[Redis],
@@ -109,10 +229,17 @@ class DistributedLock:
 
 		self._is_copy = False
 
+	def _copy(self) -> Self:
+		# copy.copy on a slotted instance goes through __reduce_ex__; set the slots directly
+		new = object.__new__(type(self))
+		for name in DistributedLock.__slots__:
+			setattr(new, name, getattr(self, name))
+		new._is_copy = True
+		return new
+
 	def no_wait(self) -> Self:
 		if not self._is_copy:
-			new = copy(self)
-			new._is_copy = True
+			new = self._copy()
 			new._wait = False
 			return new
 
@@ -121,8 +248,7 @@ class DistributedLock:
 
 	def wait(self, *, backoff: _backoff = _DEFAULT_BACKOFF, timeout: float = 60.0) -> Self:
 		if not self._is_copy:
-			new = copy(self)
-			new._is_copy = True
+			new = self._copy()
 			new._wait = True
 			new._wait_backoff = backoff
 			new._wait_timeout = timeout
@@ -135,8 +261,7 @@ class DistributedLock:
 
 	def spin(self, *, attempts: int) -> Self:
 		if not self._is_copy:
-			new = copy(self)
-			new._is_copy = True
+			new = self._copy()
 			new._spin_attempts = attempts
 			return new
 
@@ -148,8 +273,7 @@ class DistributedLock:
 
 	def if_taken(self, *, retry: bool) -> Self:
 		if not self._is_copy:
-			new = copy(self)
-			new._is_copy = True
+			new = self._copy()
 			new._retry_if_acquired = retry
 			return new
 
@@ -158,8 +282,7 @@ class DistributedLock:
 
 	def extend(self, *, enabled: bool = True, watchdog_factor: float = 3.0) -> Self:
 		if not self._is_copy:
-			new = copy(self)
-			new._is_copy = True
+			new = self._copy()
 			new._extend_ttl = enabled
 			new._watchdog_factor = watchdog_factor
 			return new
@@ -170,100 +293,126 @@ class DistributedLock:
 
 	def exc(self, *args: Any) -> Self:
 		if not self._is_copy:
-			new = copy(self)
-			new._is_copy = True
+			new = self._copy()
 			new._exc_args = args
 			return new
 
 		self._exc_args = args
 		return self
 
-	async def _try_acquire(self, rc: Redis, key: str, ttl: int, token: str) -> bool:
-		return bool(await rc.set(key, token, nx=True, ex=ttl))
-
-	async def _spin_acquire(self, rc: Redis, key: str, ttl: int, token: str) -> bool:
-		for _ in range(self._spin_attempts):
-			if await self._try_acquire(rc, key, ttl, token):
-				return True
-			await asyncio.sleep(0)
-		return False
-
-	async def _wait_acquire(self, rc: Redis, key: str, ttl: int, token: str) -> bool:
-		start = time()
+	async def _wait_acquire(self, rc: Redis, key: str, ttl_ms: int, token: str) -> bool:
+		clock = asyncio.get_running_loop().time
+		deadline = clock() + self._wait_timeout
+		backoff = self._wait_backoff
 		attempt = 1
 		while True:
-			if await self._try_acquire(rc, key, ttl, token):
+			# one round-trip: either takes the lock or reports how long the holder has left
+			acquired, pttl = await _run_script(rc, _ACQUIRE_OR_PTTL, key, token, ttl_ms)
+			if acquired:
 				return True
 
-			if (time() - start) > self._wait_timeout:
+			remaining = deadline - clock()
+			if remaining < 0:
 				return False
 
-			await asyncio.sleep(self._wait_backoff(attempt))
+			delay = min(backoff(attempt), remaining)
+			if pttl > 0:
+				delay = min(delay, pttl / 1000)
+			await asyncio.sleep(delay)
 			attempt += 1
 
-	def acq(self, key: strable, timeout: int = 5) -> AbstractAsyncContextManager[None]:
+	def acq(self, key: strable, timeout: float = 5) -> AbstractAsyncContextManager[None]:
 		return self.acquire(key, ttl=timeout)
 
-	@asynccontextmanager
-	async def acquire(self, key: Any, *, ttl: int = 5) -> AsyncGenerator[None]:
+	def acquire(self, key: Any, *, ttl: float = 5) -> AbstractAsyncContextManager[None]:
 		if not strable.valid(key):
 			raise TypeError(f"type {type(key)} does not implement strable")
 
-		key = str(key)
-		token = os.urandom(16).hex()
-		acquired = False
-		watchdog: asyncio.Task[None] | None = None
+		return _LockCtx(self, str(key), ttl)
+
+	@classmethod
+	def _watchdog(cls, rc: Redis) -> _WatchdogRegistry:
+		registry = cls._watchdogs.get(rc)
+		if registry is None:
+			registry = cls._watchdogs[rc] = _WatchdogRegistry(rc)
+		return registry
 
+
+class _LockCtx:
+	__slots__ = ("_dl", "_key", "_ttl_ms", "_token", "_rc", "_acquired", "_watchdog")
+
+	def __init__(self, dl: DistributedLock, key: str, ttl: float) -> None:
+		self._dl = dl
+		self._key = key
+		# millisecond expiry so fractional ttls are honoured instead of rounded to whole seconds
+		self._ttl_ms = int(ttl * 1000)
+		# 128 random bits as 22 url-safe chars; stays readable by decode_responses clients
+		self._token = secrets.token_urlsafe(16)
+		self._rc: Redis | None = None
+		self._acquired = False
+		self._watchdog: _WatchdogRegistry | None = None
+
+	async def __aenter__(self) -> None:
+		dl, key, ttl_ms, token = self._dl, self._key, self._ttl_ms, self._token
+
+		# one client for the whole lifecycle: acquire, watchdog extends and release
+		rc = self._rc = await dl._redis_factory.__aenter__()
 		try:
-			async with self._redis_factory as rc:
-				# ph 1: spin — rapid attempts, no delay
-				if self._spin_attempts > 0:
-					acquired = await self._spin_acquire(rc, key, ttl, token)
-
-				# ph 2: single cmpswap attempt (no spin, no wait)
-				if not acquired and not self._wait:
-					acquired = await self._try_acquire(rc, key, ttl, token)
-
-				# ph 3: wait & delay
-				if not acquired and self._wait:
-					acquired = await self._wait_acquire(rc, key, ttl, token)
-
-				if not acquired:
-					if self._wait:
-						raise ContextLockError(
-							f"{key} lock already acquired, timeout after {self._wait_timeout}s",
-							*self._exc_args,
-							can_retry=False,
-						)
+			acquired = False
+
+			# ph 1: spin — rapid attempts, no delay
+			for _ in range(dl._spin_attempts):
+				if await rc.set(key, token, nx=True, px=ttl_ms):
+					acquired = True
+					break
+				await asyncio.sleep(0)
+
+			# ph 2: single cmpswap attempt (no spin, no wait)
+			if not acquired and not dl._wait:
+				acquired = bool(await rc.set(key, token, nx=True, px=ttl_ms))
+
+			# ph 3: wait & delay
+			if not acquired and dl._wait:
+				acquired = await dl._wait_acquire(rc, key, ttl_ms, token)
+
+			self._acquired = acquired
+			if not acquired:
+				if dl._wait:
 					raise ContextLockError(
-						f"{key} lock already acquired",
-						*self._exc_args,
-						can_retry=self._retry_if_acquired,
+						f"{key} lock already acquired, timeout after {dl._wait_timeout}s",
+						*dl._exc_args,
+						can_retry=False,
 					)
+				raise ContextLockError(
+					f"{key} lock already acquired",
+					*dl._exc_args,
+					can_retry=dl._retry_if_acquired,
+				)
 
 			# start watchdog to extend TTL while lock is held
-			if acquired and self._extend_ttl:
-				watchdog = asyncio.create_task(self._watchdog(key, token, ttl))
-
-			yield
-		finally:
-			if watchdog is not None:
-				watchdog.cancel()
-				with suppress(asyncio.CancelledError):
-					await watchdog
-
-			if acquired:
-				async with self._redis_factory as rc:
-					await rc.eval(_RELEASE_LUA, 1, key, token)  # type: ignore[arg-type]
-
-	async def _watchdog(self, key: str, token: str, ttl: int) -> None:
-		interval = ttl / self._watchdog_factor
+			if dl._extend_ttl:
+				self._watchdog = dl._watchdog(rc)
+				self._watchdog.add(key, token, ttl_ms, ttl_ms / 1000 / dl._watchdog_factor)
+		except BaseException as e:
+			await self.__aexit__(type(e), e, e.__traceback__)
+			raise
+
+	async def __aexit__(
+		self,
+		exc_type: type[BaseException] | None,
+		exc_val: BaseException | None,
+		exc_tb: TracebackType | None,
+	) -> None:
+		factory = self._dl._redis_factory
 		try:
-			while True:
-				await asyncio.sleep(interval)
-				async with self._redis_factory as rc:
-					result = await rc.eval(_EXTEND_LUA, 1, key, token, ttl)  # type: ignore[arg-type]
-					if not result:
-						return
-		except asyncio.CancelledError:
-			return
+			if self._watchdog is not None:
+				self._watchdog.discard(self._key, self._token)
+
+			if self._acquired:
+				await _run_script(self._rc, _RELEASE, self._key, self._token)  # type: ignore[arg-type]
+		except BaseException as e:
+			await factory.__aexit__(type(e), e, e.__traceback__)
+			raise
+		# the client only served the lock calls: the body's exception is not the factory's to
+		# handle, and its result must not suppress it
+		await factory.__aexit__(None, None, None)
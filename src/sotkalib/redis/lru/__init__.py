@@ -1,5 +1,5 @@
 from .abcs import keyfunc
-from .cache import RedisLRU
+from .cache import CachedFailureError, RedisLRU
 from .settings import LRUSettings
 
-__all__ = ("keyfunc", "LRUSettings", "RedisLRU")
+__all__ = ("keyfunc", "LRUSettings", "RedisLRU", "CachedFailureError")
@@ -1,11 +1,12 @@
-import os
+import asyncio
 import typing
+import weakref
 from _warnings import warn
 from contextlib import AbstractAsyncContextManager
-from copy import copy
 from functools import wraps
 
 from redis import asyncio as aioredis
+from redis.client import NEVER_DECODE
 
 from ...serializer.abc import Serializer
 from ...type import generics, iface
@@ -21,8 +22,29 @@ _no_rtype_with_typed_warn = lambda styp, func: warn(  # noqa: E731
 )
 
 
+_RAW_GET_OPTIONS = {NEVER_DECODE: True}
+
+# stored instead of a result while a failure is negatively cached; serializers never emit this
+_FAILED = b"\x00sotkalib.lru:failed\x00"
+
+# in-flight result when the leading call was cancelled: a waiter takes over and calls again
+_RETRY = object()
+
+
+class CachedFailureError(Exception):
+	"""Raised instead of calling the function while its last failure is still cached."""
+
+
 def _get_rtype(func) -> typing.Any | None:
-	return typing.get_type_hints(func).get("return")
+	# only the return hint is needed: resolve every annotation only for a string forward ref
+	annotations = getattr(func, "__annotations__", None) or {}
+	if "return" not in annotations:
+		return None
+
+	rtype = annotations["return"]
+	if isinstance(rtype, str):
+		return typing.get_type_hints(func).get("return")
+	return type(None) if rtype is None else rtype
 
 
 class RedisLRU:
@@ -32,8 +54,8 @@ class RedisLRU:
 		"_ttl",
 		"_serializer",
 		"_keyfunc",
+		"_error_ttl",
 		"_is_copy",
-		"__pickle_allowed",
 	)
 
 	def __init__(
@@ -44,18 +66,25 @@ class RedisLRU:
 		if settings is None:
 			settings = LRUSettings()
 
-		self.__pickle_allowed = (os.getenv("SOTKALIB_ALLOW_PICKLE", "").lower() == "yes") or False
 		self._redis_factory = redis_factory
 		self._version = settings.version
 		self._ttl = settings.ttl
 		self._serializer = settings.serializer
 		self._keyfunc = settings.keyfunc
+		self._error_ttl = settings.error_ttl
 		self._is_copy = False
 
+	def _copy(self) -> typing.Self:
+		# copy.copy on a slotted instance goes through __reduce_ex__; set the slots directly
+		new = object.__new__(type(self))
+		for name in RedisLRU.__slots__:
+			setattr(new, name, getattr(self, name))
+		new._is_copy = True
+		return new
+
 	def ttl(self, ttl: int) -> typing.Self:
 		if not self._is_copy:
-			new_self = copy(self)
-			new_self._is_copy = True
+			new_self = self._copy()
 			new_self._ttl = ttl
 			return new_self
 		self._ttl = ttl
@@ -63,8 +92,7 @@ class RedisLRU:
 
 	def version(self, ver: int) -> typing.Self:
 		if not self._is_copy:
-			new_self = copy(self)
-			new_self._is_copy = True
+			new_self = self._copy()
 			new_self._version = ver
 			return new_self
 		self._version = ver
@@ -72,8 +100,7 @@ class RedisLRU:
 
 	def serializer(self, szr: Serializer) -> typing.Self:
 		if not self._is_copy:
-			new_self = copy(self)
-			new_self._is_copy = True
+			new_self = self._copy()
 			new_self._serializer = szr
 			return new_self
 
@@ -82,14 +109,22 @@ class RedisLRU:
 
 	def keyfunc(self, kf: keyfunc) -> typing.Self:
 		if not self._is_copy:
-			new_self = copy(self)
-			new_self._is_copy = True
+			new_self = self._copy()
 			new_self._keyfunc = kf
 			return new_self
 
 		self._keyfunc = kf
 		return self
 
+	def error_ttl(self, ttl: int | None) -> typing.Self:
+		if not self._is_copy:
+			new_self = self._copy()
+			new_self._error_ttl = ttl
+			return new_self
+
+		self._error_ttl = ttl
+		return self
+
 	def __call__[**P, R](
 		self, func: generics.async_function[P, R]
 	) -> generics.async_function[P, R]:
@@ -103,22 +138,71 @@ class RedisLRU:
 			else:
 				_no_rtype_with_typed_warn(styp, func)
 
+		# per decorated function and running loop: cache key -> future of the call filling it
+		inflight: weakref.WeakKeyDictionary[
+			asyncio.AbstractEventLoop, dict[str, asyncio.Future[typing.Any]]
+		] = weakref.WeakKeyDictionary()
+
+		# qualified, so same-named functions in other modules or classes get their own keys
+		func_name = f"{func.__module__}.{func.__qualname__}"
+
 		@wraps(func)
 		async def inner(*args: P.args, **kwargs: P.kwargs) -> R:
-			cache_func_key = self._keyfunc(self._version, func.__name__, *args, **kwargs)  # type: ignore[arg-type]
-			async with self._redis_factory as rc:
-				cached_result: bytes | str | None = await rc.get(cache_func_key)
-				if cached_result is not None:
-					if isinstance(cached_result, str):
-						cached_result = cached_result.encode()
-					return self._serializer.unmarshal(cached_result)
-			result = await func(*args, **kwargs)
-			async with self._redis_factory as rc:
-				await rc.set(
-					cache_func_key,
-					self._serializer.marshal(result),
-					ex=self._ttl,
-				)
-			return result
+			cache_func_key = self._keyfunc(self._version, func_name, *args, **kwargs)  # type: ignore[arg-type]
+
+			loop = asyncio.get_running_loop()
+			if (pending_calls := inflight.get(loop)) is None:
+				pending_calls = inflight[loop] = {}
+
+			while (pending := pending_calls.get(cache_func_key)) is not None:
+				# shield so a cancelled waiter does not cancel the leader's future
+				result = await asyncio.shield(pending)
+				if result is not _RETRY:
+					return result
+
+			fut = pending_calls[cache_func_key] = loop.create_future()
+			try:
+				result = await self._lookup_or_call(cache_func_key, func, args, kwargs)
+			except asyncio.CancelledError:
+				fut.set_result(_RETRY)
+				raise
+			except BaseException as e:
+				fut.set_exception(e)
+				# waiters re-raise it; without any, don't report it as never retrieved
+				fut.exception()
+				raise
+			else:
+				fut.set_result(result)
+				return result
+			finally:
+				pending_calls.pop(cache_func_key, None)
 
 		return inner
+
+	async def _lookup_or_call(
+		self, cache_func_key: str, func: typing.Callable, args: tuple, kwargs: dict
+	) -> typing.Any:
+		async with self._redis_factory as rc:
+			# raw bytes even on decode_responses pools: no decode here and re-encode for unmarshal
+			cached_result: bytes | None = await rc.execute_command(
+				"GET", cache_func_key, **_RAW_GET_OPTIONS
+			)
+			if cached_result is not None:
+				if cached_result == _FAILED:
+					raise CachedFailureError(
+						f"{func.__name__} failed recently, cached failure key {cache_func_key}"
+					)
+				return self._serializer.unmarshal(cached_result)
+
+			try:
+				result = await func(*args, **kwargs)
+			except Exception:
+				if self._error_ttl:
+					await rc.set(cache_func_key, _FAILED, ex=self._error_ttl)
+				raise
+			await rc.set(
+				cache_func_key,
+				self._serializer.marshal(result),
+				ex=self._ttl,
+			)
+		return result
@@ -1,5 +1,6 @@
+import pickle
 from dataclasses import dataclass
-from datetime import datetime
+from hashlib import blake2b
 from typing import Any
 
 from ...serializer.abc import Serializer
@@ -7,8 +8,27 @@ from ...serializer.impl.pickle import B64Pickle
 from .abcs import keyfunc
 
 
+def _pickled(value: Any) -> bytes:
+	return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _canonical(value: Any) -> Any:
+	# sets pickle in hash order (seeded per process) and dicts in insertion order: sort their
+	# members by pickled form so equal arguments hash the same everywhere, whatever their types
+	if isinstance(value, (set, frozenset)):
+		return type(value), sorted(map(_canonical, value), key=_pickled)
+	if isinstance(value, dict):
+		items = ((_canonical(k), _canonical(v)) for k, v in value.items())
+		return type(value), sorted(items, key=_pickled)
+	if type(value) is list or type(value) is tuple:
+		return type(value)(map(_canonical, value))
+	return value
+
+
 def base_keyfunc(version: int, func_name: str, *args: tuple, **kwargs: dict[str, Any]) -> str:
-	return f"{version}_{datetime.now().isoformat()}_{func_name}_{B64Pickle.marshal((args, kwargs))}"
+	# fixed-size digest of the call arguments; kwargs are sorted so keyword order does not matter
+	payload = _pickled((_canonical(args), _canonical(kwargs)))
+	return f"{version}_{func_name}_{blake2b(payload, digest_size=16).hexdigest()}"
 
 
 @dataclass(slots=True, kw_only=True)
@@ -17,3 +37,5 @@ class LRUSettings:
 	ttl: int = 600
 	serializer: Serializer = B64Pickle
 	keyfunc: keyfunc = base_keyfunc
+	# seconds to remember that a call raised; None disables negative caching
+	error_ttl: int | None = None
@@ -1,20 +1,57 @@
 import asyncio
+import weakref
 from contextlib import AbstractAsyncContextManager
-from typing import Self
+from dataclasses import astuple, dataclass
+from typing import Any, Self
 
-from pydantic import BaseModel, Field
 from redis.asyncio import ConnectionPool, Redis
 
 
-class RedisPoolSettings(BaseModel):
-	uri: str = Field(default="redis://localhost:6379")
-	db_num: int = Field(default=4)
-	max_connections: int = Field(default=50)
-	socket_timeout: float = Field(default=5)
-	socket_connect_timeout: float = Field(default=5)
-	retry_on_timeout: bool = Field(default=True)
-	health_check_interval: float = Field(default=30)
-	decode_responses: bool = Field(default=True)
+@dataclass(slots=True, kw_only=True)
+class RedisPoolSettings:
+	uri: str = "redis://localhost:6379"
+	db_num: int = 4
+	max_connections: int = 50
+	socket_timeout: float = 5
+	socket_connect_timeout: float = 5
+	retry_on_timeout: bool = True
+	health_check_interval: float = 30
+	decode_responses: bool = True
+	# None keeps redis-py's pick: the hiredis C parser when installed, the pure-python one otherwise
+	parser_class: type | None = None
+
+
+# settings -> pool, per event loop: asyncio connections must not outlive the loop that opened them
+_POOLS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple, ConnectionPool]] = (
+	weakref.WeakKeyDictionary()
+)
+_UNBOUND_POOLS: dict[tuple, ConnectionPool] = {}
+
+
+def _shared_pool(settings: RedisPoolSettings) -> ConnectionPool:
+	try:
+		pools = _POOLS.setdefault(asyncio.get_running_loop(), {})
+	except RuntimeError:
+		pools = _UNBOUND_POOLS
+
+	key = astuple(settings)
+	pool = pools.get(key)
+	if pool is None:
+		extra: dict[str, Any] = {}
+		if settings.parser_class is not None:
+			extra["parser_class"] = settings.parser_class
+
+		pool = pools[key] = ConnectionPool.from_url(
+			settings.uri + "/" + str(settings.db_num),
+			max_connections=settings.max_connections,
+			socket_timeout=settings.socket_timeout,
+			socket_connect_timeout=settings.socket_connect_timeout,
+			retry_on_timeout=settings.retry_on_timeout,
+			health_check_interval=settings.health_check_interval,
+			decode_responses=settings.decode_responses,
+			**extra,
+		)
+	return pool
 
 
 class RedisPool(AbstractAsyncContextManager):
@@ -22,18 +59,13 @@ class RedisPool(AbstractAsyncContextManager):
 		if not settings:
 			settings = RedisPoolSettings()
 
-		self._pool = ConnectionPool.from_url(
-			settings.uri + "/" + str(settings.db_num),
-			**settings.model_dump(exclude={"uri", "db_num"}),
-		)
+		# equal settings share one set of connections across RedisPool instances
+		self._pool = _shared_pool(settings)
 
-		self._usage_counter = 0
-		self._usage_lock = asyncio.Lock()
+		# the client is a thin command dispatcher over the pool, safe to share between tasks
+		self._client = Redis(connection_pool=self._pool)
 
 	async def __aenter__(self: Self) -> Redis:
-		try:
-			return Redis(connection_pool=self._pool)
-		except Exception:
-			raise
+		return self._client
 
 	async def __aexit__(self, exc_type, exc_value, traceback): ...
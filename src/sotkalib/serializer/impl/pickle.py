@@ -10,20 +10,24 @@ _pickle_allowed = (os.getenv("SOTKALIB_ALLOW_PICKLE", "").lower() == "yes") or F
 class SecurityWarning(Warning): ...
 
 
+def _warn_pickle() -> None:
+	warn(
+		"sotkalib.redis.lru is using pickle serializer.\n\n"
+		"This is not recommended for production, "
+		"as deserialization with pickle may execute arbitrary code.\n"
+		"You may silence this warning by using a different serializer"
+		"or setting the environment variable "
+		"SOTKALIB_ALLOW_PICKLE to yes.",
+		stacklevel=3,
+		category=SecurityWarning,
+	)
+
+
 class B64Pickle:
 	@staticmethod
 	def marshal(data: Any) -> bytes:
 		if not _pickle_allowed:
-			warn(
-				"sotkalib.redis.lru is using pickle serializer.\n\n"
-				"This is not recommended for production, "
-				"as deserialization with pickle may execute arbitrary code.\n"
-				"You may silence this warning by using a different serializer"
-				"or setting the environment variable "
-				"SOTKALIB_ALLOW_PICKLE to yes.",
-				stacklevel=2,
-				category=SecurityWarning,
-			)
+			_warn_pickle()
 
 		dumped = dumps(data, protocol=HIGHEST_PROTOCOL)
 		dumped_b64 = b64encode(dumped)
@@ -32,3 +36,18 @@ class B64Pickle:
 	@staticmethod
 	def unmarshal(raw_data: bytes) -> Any:
 		return loads(b64decode(raw_data))  # noqa
+
+
+class RawPickle:
+	"""Pickle without the base64 framing; needs a client that returns raw bytes on read."""
+
+	@staticmethod
+	def marshal(data: Any) -> bytes:
+		if not _pickle_allowed:
+			_warn_pickle()
+
+		return dumps(data, protocol=HIGHEST_PROTOCOL)
+
+	@staticmethod
+	def unmarshal(raw_data: bytes) -> Any:
+		return loads(raw_data)  # noqa
@@ -4,12 +4,16 @@ from .mixin import TypedSerializerGenericMixin
 
 
 class PydanticSerializer[T: BaseModel](TypedSerializerGenericMixin):
+	# both go straight to pydantic-core: model_dump_json would decode the JSON bytes to str
+	# only for marshal to encode them again
+
 	def marshal(self, data: T) -> bytes:  # noqa
-		return data.model_dump_json(
+		return data.__pydantic_serializer__.to_json(
+			data,
 			exclude_unset=True,
 			exclude_defaults=True,
 			exclude_computed_fields=True,
-		).encode()
+		)
 
 	def unmarshal(self, raw_data: bytes) -> T:
-		return self.type_.model_validate_strings(raw_data)
+		return self.type_.__pydantic_validator__.validate_json(raw_data)
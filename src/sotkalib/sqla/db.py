@@ -1,12 +1,9 @@
 import functools
 import inspect
-from collections.abc import AsyncGenerator, Callable, Generator
-from contextlib import (
-	asynccontextmanager,
-	contextmanager,
-)
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Concatenate, Self, overload
+from types import TracebackType
+from typing import Concatenate, NoReturn, Self, overload
 
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
@@ -36,17 +33,33 @@ def _raise_on_uninitialized[**p, r](
 def _raise_on_uninitialized[**p, r](
 	func: Callable[Concatenate["Database", p], r | coro[r]],
 ) -> Callable[Concatenate["Database", p], r | coro[r]]:
-	@functools.wraps(func)
-	def _wrap(self: "Database", *args: p.args, **kwargs: p.kwargs) -> r | coro[r]:
-		if inspect.iscoroutinefunction(func):
+	# sync or async is fixed per function, so pick the guard once at decoration time
+	if inspect.iscoroutinefunction(func):
+
+		@functools.wraps(func)
+		def _awrap(self: "Database", *args: p.args, **kwargs: p.kwargs) -> r | coro[r]:
 			if not self._async_enabled:
-				raise RuntimeError("async engine is not initialized for this instance")
-		elif not self._sync_enabled:
-			raise RuntimeError("sync engine is not initialized for this instance")
+				_uninitialized_async()
+			return func(self, *args, **kwargs)
 
+		# returns func's coroutine as-is; keep the wrapper detectable as a coroutine function
+		return inspect.markcoroutinefunction(_awrap)
+
+	@functools.wraps(func)
+	def _swrap(self: "Database", *args: p.args, **kwargs: p.kwargs) -> r | coro[r]:
+		if not self._sync_enabled:
+			_uninitialized_sync()
 		return func(self, *args, **kwargs)
 
-	return _wrap
+	return _swrap
+
+
+def _uninitialized_sync() -> NoReturn:
+	raise RuntimeError("sync engine is not initialized for this instance")
+
+
+def _uninitialized_async() -> NoReturn:
+	raise RuntimeError("async engine is not initialized for this instance")
 
 
 class ConnectionTimeoutError(Exception):
@@ -81,6 +94,8 @@ class Database:
 		"_async_engine",
 		"_async_session_factory",
 		"_sync_enabled",
+		"_session_scope",
+		"_asession_scope",
 	)
 
 	def __init__(self, settings: DatabaseSettings):
@@ -114,19 +129,38 @@ class Database:
 				expire_on_commit=settings.expire_on_commit,
 			)
 
-	@_raise_on_uninitialized
+		# `session`/`asession` are hit per unit of work: resolve mode and safety once, here
+		self._session_scope: Callable[[], contextmgr[Session]] = _uninitialized_sync
+		if self._sync_enabled:
+			self._session_scope = (
+				functools.partial(_safe, self._sync_session_factory)
+				if self._implicit_safe
+				else self._sync_session_factory
+			)
+
+		self._asession_scope: Callable[[], async_contextmgr[AsyncSession]] = _uninitialized_async
+		if self._async_enabled:
+			self._asession_scope = (
+				functools.partial(_asafe, self._async_session_factory)
+				if self._implicit_safe
+				else self._async_session_factory
+			)
+
+	# guards inlined: these run on every `with db` and close()/aclose() already check the mode
+
 	def __enter__(self) -> Self:
+		if not self._sync_enabled:
+			_uninitialized_sync()
 		return self
 
-	@_raise_on_uninitialized
 	def __exit__(self, exc_type, exc_val, exc_tb) -> None:
 		self.close()
 
-	@_raise_on_uninitialized
 	async def __aenter__(self) -> Self:
+		if not self._async_enabled:
+			_uninitialized_async()
 		return self
 
-	@_raise_on_uninitialized
 	async def __aexit__(self, *args) -> None:
 		await self.aclose()
 
@@ -163,18 +197,20 @@ class Database:
 			await aconn.run_sync(self._decl_base.metadata.drop_all)  # type:ignore
 
 	@property
-	@_raise_on_uninitialized
 	def asession_unsafe(self) -> async_contextmgr[AsyncSession]:
+		if not self._async_enabled:
+			_uninitialized_async()
 		return self._async_session_factory()
 
 	@property
-	@_raise_on_uninitialized
 	def asession_safe(self) -> async_contextmgr[AsyncSession]:
+		if not self._async_enabled:
+			_uninitialized_async()
 		return _asafe(self._async_session_factory)
 
 	@property
 	def asession(self) -> async_contextmgr[AsyncSession]:
-		return self.asession_safe if self._implicit_safe else self.asession_unsafe
+		return self._asession_scope()
 
 	@property
 	def async_session(self) -> async_contextmgr[AsyncSession]:
@@ -182,16 +218,19 @@ class Database:
 
 	@property
 	def session_unsafe(self) -> contextmgr[Session]:
+		if not self._sync_enabled:
+			_uninitialized_sync()
 		return self._sync_session_factory()
 
 	@property
 	def session_safe(self) -> contextmgr[Session]:
+		if not self._sync_enabled:
+			_uninitialized_sync()
 		return _safe(self._sync_session_factory)
 
 	@property
-	@_raise_on_uninitialized
 	def session(self) -> contextmgr[Session]:
-		return self.session_safe if self._implicit_safe else self.session_unsafe
+		return self._session_scope()
 
 	async def aclose(self):
 		if self._async_enabled:
@@ -204,37 +243,73 @@ class Database:
 			get_logger("db").debug("disposed of sync engine")
 
 
-@contextmanager
-def _safe(sm: sessionmaker[Session]) -> Generator[Session]:
-	session = None
-
-	try:
-		session: Session = sm()
-		yield session
-		session.commit()
-	except:
-		if session is not None:
-			session.rollback()
-		raise
-	finally:
-		if session is not None:
+class _safe:  # noqa: N801
+	"""Session scope that commits on success, rolls back on error and always closes."""
+
+	__slots__ = ("_sm", "_session")
+
+	def __init__(self, sm: sessionmaker[Session]) -> None:
+		self._sm = sm
+		self._session: Session | None = None
+
+	def __enter__(self) -> Session:
+		session = self._session = self._sm()
+		return session
+
+	def __exit__(
+		self,
+		exc_type: type[BaseException] | None,
+		exc_val: BaseException | None,
+		exc_tb: TracebackType | None,
+	) -> None:
+		session = self._session
+		if session is None:
+			return
+
+		try:
+			if exc_type is None:
+				try:
+					session.commit()
+				except BaseException:
+					session.rollback()
+					raise
+			else:
+				session.rollback()
+		finally:
 			session.close()
 
 
-@asynccontextmanager
-async def _asafe(
-	asm: async_sessionmaker[AsyncSession],
-) -> AsyncGenerator[AsyncSession]:
-	session = None
-
-	try:
-		session: AsyncSession = asm()
-		yield session
-		await session.commit()
-	except:
-		if session is not None:
-			await session.rollback()
-		raise
-	finally:
-		if session is not None:
+class _asafe:  # noqa: N801
+	"""Async session scope that commits on success, rolls back on error and always closes."""
+
+	__slots__ = ("_asm", "_session")
+
+	def __init__(self, asm: async_sessionmaker[AsyncSession]) -> None:
+		self._asm = asm
+		self._session: AsyncSession | None = None
+
+	async def __aenter__(self) -> AsyncSession:
+		session = self._session = self._asm()
+		return session
+
+	async def __aexit__(
+		self,
+		exc_type: type[BaseException] | None,
+		exc_val: BaseException | None,
+		exc_tb: TracebackType | None,
+	) -> None:
+		session = self._session
+		if session is None:
+			return
+
+		try:
+			if exc_type is None:
+				try:
+					await session.commit()
+				except BaseException:
+					await session.rollback()
+					raise
+			else:
+				await session.rollback()
+		finally:
 			await session.close()
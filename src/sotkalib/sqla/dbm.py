@@ -1,4 +1,5 @@
 from typing import Any, Self
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel
 from sqlalchemy import inspect
@@ -10,6 +11,35 @@ from sotkalib.type.unset import is_unset
 from ..type.unset import Unset
 from .validate import _autoset
 
+# per-class column metadata; mappers are configured after class creation, so filled on first use
+_COLUMN_NAMES: WeakKeyDictionary[type, tuple[str, ...]] = WeakKeyDictionary()
+_MERGEABLE_ATTRS: WeakKeyDictionary[type, frozenset[str]] = WeakKeyDictionary()
+_ORM_DESCRIPTOR_KEYS: WeakKeyDictionary[type, frozenset[str]] = WeakKeyDictionary()
+
+
+def _column_names(cls: type[DeclarativeBase]) -> tuple[str, ...]:
+	names = _COLUMN_NAMES.get(cls)
+	if names is None:
+		names = _COLUMN_NAMES[cls] = tuple(c.name for c in cls.__mapper__.c)
+	return names
+
+
+def _mergeable_attrs(cls: type[DeclarativeBase]) -> frozenset[str]:
+	attrs = _MERGEABLE_ATTRS.get(cls)
+	if attrs is None:
+		mapper = cls.__mapper__
+		attrs = _MERGEABLE_ATTRS[cls] = frozenset(
+			c.key for c in mapper.c if c not in mapper.primary_key or not _autoset(c)
+		)
+	return attrs
+
+
+def _orm_descriptor_keys(cls: type[DeclarativeBase]) -> frozenset[str]:
+	keys = _ORM_DESCRIPTOR_KEYS.get(cls)
+	if keys is None:
+		keys = _ORM_DESCRIPTOR_KEYS[cls] = frozenset(cls.__mapper__.all_orm_descriptors.keys())
+	return keys
+
 
 class BasicDBM(DeclarativeBase):
 	__abstract__ = True
@@ -27,25 +57,26 @@ class BasicDBM(DeclarativeBase):
 
 		# assuming that user wants explicitly included fields only
 		# and only those that are in the model
+		model_fields = pydantic_model.model_fields.keys() if pydantic_model else None
 		include = (
-			set(explicitly_include) & set(pydantic_model.model_fields.keys())
-			if explicitly_include and pydantic_model
-			else set(pydantic_model.model_fields.keys())
-			if pydantic_model
-			else set(explicitly_include or [])
+			set(explicitly_include) & model_fields
+			if explicitly_include and model_fields is not None
+			else set(model_fields)
+			if model_fields is not None
+			else set(explicitly_include)
 		)
 
 		result = {}
 
-		for field in self.__mapper__.c:
+		for name in _column_names(type(self)):
 			# if include is empty dumping all columns to result
-			if not include or field.name in include:
-				result[field.name] = getattr(self, field.name)
+			if not include or name in include:
+				result[name] = getattr(self, name)
 
 		# checking include if it has any attrs left,
 		# that are not columns of DBM (e.g. property, smth else)
 		# diffing explicitly_set because those would be overwritten anyway
-		for k in set(include).difference(*result.keys()).difference(*explicitly_set.keys()):
+		for k in include - result.keys() - explicitly_set.keys():
 			if hasattr(self, k):
 				result[k] = getattr(self, k)
 
@@ -54,28 +85,23 @@ class BasicDBM(DeclarativeBase):
 		return result
 
 	def is_loaded(self, *, attr: str):
-		if attr not in (
-			k := {c.key for c in inspect(self).mapper.all_orm_descriptors}  # type:ignore
-		):
-			raise KeyError(k)
+		if attr not in _orm_descriptor_keys(type(self)):
+			raise KeyError(attr)
 		return attr not in inspect(self).unloaded
 
 	def merge(self, *, strict: bool = False, **attrs):
-		valid_attrs = {
-			c.key
-			for c in self.__mapper__.c
-			if c not in self.__mapper__.primary_key or not _autoset(c)
-		}
+		valid_attrs = _mergeable_attrs(type(self))
 
 		if strict and not valid_attrs.issuperset(attrs.keys()):
 			raise AttributeError(set(attrs.keys()).difference(valid_attrs))
 
-		modified_attrs = valid_attrs.copy()
+		# built fresh: valid_attrs is the shared per-class set
+		modified_attrs = set()
 
 		for c in valid_attrs:
 			val = attrs.get(c, Unset)
-			if is_unset(val) or getattr(self, c) == attrs.get(c):
-				modified_attrs.remove(c)
+			if not is_unset(val) and getattr(self, c) != val:
+				modified_attrs.add(c)
 
 		self.__dict__ |= {k: v for k, v in attrs.items() if k in modified_attrs}
 
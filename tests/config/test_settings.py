@@ -1,5 +1,8 @@
+import os
+
 import pytest
 
+from sotkalib.config import struct
 from sotkalib.config.field import SettingsField
 from sotkalib.config.struct import AppSettings
 
@@ -53,6 +56,19 @@ class TestAppSettings:
 		s = Settings()
 		assert s.MY_VAR == "from_property"
 
+	def test_factory_property_env_takes_precedence(self, monkeypatch):
+		monkeypatch.setenv("MY_VAR", "from_env")
+
+		class Settings(AppSettings):
+			MY_VAR: str = SettingsField(factory="computed")
+
+			@property
+			def computed(self) -> str:
+				return "from_property"
+
+		s = Settings()
+		assert s.MY_VAR == "from_env"
+
 	def test_factory_property_missing(self):
 		class Settings(AppSettings):
 			MY_VAR: str = SettingsField(factory="nonexistent")
@@ -70,6 +86,25 @@ class TestAppSettings:
 		with pytest.raises(TypeError, match="not a property"):
 			Settings()
 
+	def test_inherited_fields(self, monkeypatch):
+		monkeypatch.setenv("MY_PORT", "8080")
+
+		class Base(AppSettings):
+			MY_PORT: int = SettingsField(nullable=False)
+			MY_VAR: str = SettingsField(factory="computed")
+
+			@property
+			def computed(self) -> str:
+				return f"port={self.MY_PORT}"
+
+		class Settings(Base):
+			MY_OTHER: str = SettingsField(default="other")
+
+		s = Settings()
+		assert s.MY_PORT == 8080
+		assert s.MY_VAR == "port=8080"
+		assert s.MY_OTHER == "other"
+
 	def test_nullable(self):
 		class Settings(AppSettings):
 			MY_VAR: str | None = SettingsField(nullable=True)
@@ -91,6 +126,13 @@ class TestAppSettings:
 		with pytest.raises(AttributeError, match="capital letters"):
 			Settings(explicit_format=True)
 
+	def test_explicit_format_rejects_mixed_case(self):
+		class Settings(AppSettings):
+			A_lowercase_name: str = SettingsField(default="x")
+
+		with pytest.raises(AttributeError, match="capital letters"):
+			Settings(explicit_format=True)
+
 	def test_explicit_format_off_allows_lowercase(self):
 		class Settings(AppSettings):
 			bad_name: str = SettingsField(default="x")
@@ -107,6 +149,15 @@ class TestAppSettings:
 		s = Settings()
 		assert s.MY_FLAG is True
 
+	def test_bool_on_from_env(self, monkeypatch):
+		monkeypatch.setenv("MY_FLAG", "ON")
+
+		class Settings(AppSettings):
+			MY_FLAG: bool = SettingsField(nullable=False)
+
+		s = Settings()
+		assert s.MY_FLAG is True
+
 	def test_bool_false_from_env(self, monkeypatch):
 		monkeypatch.setenv("MY_FLAG", "no")
 
@@ -140,3 +191,28 @@ class TestAppSettings:
 			s = Settings(strict=False)
 
 		assert s.MY_VAR is None
+
+	def test_strict_rejects_mutable_default(self):
+		class Settings(AppSettings):
+			# pyrefly: ignore [bad-specialization]
+			MY_VAR: str = SettingsField(default=[1, 2, 3])
+
+		with pytest.raises(TypeError, match="not an allowed immutable type"):
+			Settings(strict=True)
+
+	def test_dotenv_loaded_once_per_file(self, tmp_path, monkeypatch):
+		dotenv = tmp_path / ".env"
+		dotenv.write_text("MY_VAR=from_dotenv\n")
+		calls = []
+		monkeypatch.setattr(struct, "load_dotenv", lambda **kw: calls.append(kw))
+
+		class Settings(AppSettings):
+			MY_VAR: str = SettingsField(default="fallback")
+
+		Settings(dotenv_path=dotenv)
+		Settings(dotenv_path=dotenv)
+		assert len(calls) == 1
+
+		os.utime(dotenv, (0, 0))
+		Settings(dotenv_path=dotenv)
+		assert len(calls) == 2
@@ -1,4 +1,6 @@
-from sotkalib.dict.util import valid
+import copy
+
+from sotkalib.dict.util import unset, valid
 from sotkalib.type import Unset
 
 
@@ -17,3 +19,19 @@ class TestWithoutUnset:
 
 	def test_no_unset(self):
 		assert valid({"a": 1, "b": 2}) == {"a": 1, "b": 2}
+
+	def test_copied_unset(self):
+		d = {"a": 1, "b": copy.deepcopy(Unset), "c": copy.copy(Unset)}
+		assert valid(d) == {"a": 1}
+
+
+class TestUnset:
+	def test_keeps_only_unset_values(self):
+		assert unset({"a": 1, "b": Unset, "c": None}) == {"b": Unset}
+
+	def test_empty_dict(self):
+		assert unset({}) == {}
+
+	def test_copied_unset(self):
+		d = {"a": 1, "b": copy.deepcopy(Unset)}
+		assert list(unset(d)) == ["b"]
@@ -1,4 +1,5 @@
 from enum import auto
+from typing import Any
 
 import pytest
 
@@ -27,6 +28,15 @@ class TestUppercaseMixin:
 		assert isinstance(Color.red, str)
 
 
+class Mood(ValidatorMixin):
+	happy = "happy"
+	sad = "sad"
+
+	@classmethod
+	def _missing_(cls, value: object) -> Any:
+		return cls._value2member_map_.get(str(value).lower())
+
+
 class TestValidatorMixin:
 	def test_validate_valid(self):
 		assert Fruit.validate(val="apple") is Fruit.apple
@@ -64,6 +74,11 @@ class TestValidatorMixin:
 	def test_get_none(self):
 		assert Fruit.get(None) is None
 
+	def test_validate_uses_missing_hook(self):
+		assert Mood.validate(val="HAPPY") is Mood.happy
+		assert Mood.get("Sad") is Mood.sad
+		assert Mood.get("angry") is None
+
 	def test_in_(self):
 		assert Fruit.apple.in_(Fruit.apple, Fruit.banana) is True
 		assert Fruit.cherry.in_(Fruit.apple, Fruit.banana) is False
@@ -56,6 +56,10 @@ class TestAPIError:
 		assert err.ctx == ["field1", "field2"]
 		assert err.schema.ctx == ["field1", "field2"]
 
+	def test_detail_matches_schema_json(self):
+		err = APIError(code="E1", desc="bad", ctx={"field": "name", "n": 1})
+		assert err.detail == err.schema.model_dump_json()
+
 	def test_inherits_base_http_error(self):
 		err = APIError(status=422, code="VALIDATION")
 		assert isinstance(err, BaseHTTPError)
@@ -12,6 +12,19 @@ class TestArgsIncludedError:
 		err = ArgsIncludedError("msg", stack_depth=0)
 		assert err.args[0] == "msg"
 
+	def test_captures_nearest_frame_args(self):
+		def inner(x, *, y):  # noqa: ARG001
+			raise ArgsIncludedError("msg", stack_depth=1)
+
+		with pytest.raises(ArgsIncludedError) as exc_info:
+			inner(1, y=2)
+
+		msg, frame = exc_info.value.args
+		assert msg == "msg"
+		assert frame["frame_name"] == "inner"
+		assert frame["x"] == 1
+		assert frame["y"] == 2
+
 	def test_is_exception(self):
 		assert issubclass(ArgsIncludedError, Exception)
 
@@ -41,6 +54,25 @@ class TestExceptionHandler:
 
 		assert my_func.__name__ == "my_func"
 
+	def test_uses_given_logger(self):
+		calls = []
+
+		class Recorder:
+			def is_enabled_for(self, _level):
+				return True
+
+			def exception(self, event):
+				calls.append(event)
+
+		def failing():
+			raise ValueError("boom")
+
+		# pyrefly: ignore [bad-argument-type]
+		wrapped = exception_handler(failing, logger=Recorder())
+		with pytest.raises(ArgsIncludedError):
+			wrapped()
+		assert calls == [""]
+
 
 class TestAExceptionHandler:
 	@pytest.mark.asyncio
@@ -1,3 +1,5 @@
+from functools import partial
+
 import pytest
 
 from sotkalib.func.concur import asyncfn, asyncfn_or_raise
@@ -21,6 +23,15 @@ class TestAsyncfn:
 	def test_returns_false_for_lambda(self):
 		assert asyncfn(lambda: None) is False
 
+	def test_unwraps_partial_and_bound_method(self):
+		class Client:
+			async def fetch(self):
+				pass
+
+		assert asyncfn(partial(async_func)) is True
+		assert asyncfn(Client().fetch) is True
+		assert asyncfn(partial(sync_func)) is False
+
 
 class TestAsyncfnOrRaise:
 	def test_raises_for_sync(self):
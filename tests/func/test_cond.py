@@ -19,6 +19,10 @@ class TestSuppress:
 		):
 			raise TypeError("error")
 
+	def test_mode_exact_does_not_suppress_subclass(self):
+		with pytest.raises(FileNotFoundError), suppress(mode="exact", exact_types=[OSError]):
+			raise FileNotFoundError("error")
+
 	def test_mode_exact_warns_when_no_excts(self):
 		with (
 			pytest.warns(UserWarning, match="exact"),
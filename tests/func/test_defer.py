@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from sotkalib.func.defer import defer, defer_exc, defer_exc_mute, defer_ok
+
+
+class _Recorder:
+	def __init__(self):
+		self.calls: list[str] = []
+
+	async def mark(self, name: str):
+		self.calls.append(name)
+
+
+class TestDefer:
+	@pytest.mark.asyncio
+	async def test_runs_in_order_on_success(self):
+		rec = _Recorder()
+		async with defer(rec.mark("a"), rec.mark("b")):
+			rec.calls.append("body")
+		assert rec.calls == ["body", "a", "b"]
+
+	@pytest.mark.asyncio
+	async def test_runs_and_reraises_on_error(self):
+		rec = _Recorder()
+		with pytest.raises(ValueError, match="boom"):
+			async with defer(rec.mark("a")):
+				raise ValueError("boom")
+		assert rec.calls == ["a"]
+
+
+class TestDeferOk:
+	@pytest.mark.asyncio
+	async def test_runs_on_success(self):
+		rec = _Recorder()
+		async with defer_ok(rec.mark("a")):
+			pass
+		assert rec.calls == ["a"]
+
+	@pytest.mark.asyncio
+	async def test_skipped_on_error(self):
+		rec = _Recorder()
+		coro = rec.mark("a")
+		with pytest.raises(ValueError, match="boom"):
+			async with defer_ok(coro):
+				raise ValueError("boom")
+		coro.close()
+		assert rec.calls == []
+
+
+class TestDeferExc:
+	@pytest.mark.asyncio
+	async def test_skipped_on_success(self):
+		rec = _Recorder()
+		coro = rec.mark("a")
+		async with defer_exc(coro):
+			pass
+		coro.close()
+		assert rec.calls == []
+
+	@pytest.mark.asyncio
+	async def test_runs_and_reraises_on_error(self):
+		rec = _Recorder()
+		with pytest.raises(ValueError, match="boom"):
+			async with defer_exc(rec.mark("a")):
+				raise ValueError("boom")
+		assert rec.calls == ["a"]
+
+
+class TestDeferExcMute:
+	@pytest.mark.asyncio
+	async def test_runs_and_suppresses_on_error(self):
+		rec = _Recorder()
+		async with defer_exc_mute(rec.mark("a")):
+			raise ValueError("boom")
+		assert rec.calls == ["a"]
+
+	@pytest.mark.asyncio
+	async def test_base_exception_propagates(self):
+		rec = _Recorder()
+		coro = rec.mark("a")
+		with pytest.raises(asyncio.CancelledError):
+			async with defer_exc_mute(coro):
+				raise asyncio.CancelledError
+		coro.close()
+		assert rec.calls == []
@@ -1,3 +1,4 @@
+import socket
 import ssl
 
 import aiohttp
@@ -8,6 +9,7 @@ from aiohttp.test_utils import TestServer
 
 from sotkalib.http import (
 	ClientSettings,
+	CriticalStatusError,
 	ExceptionSettings,
 	RanOutOfAttemptsError,
 	RequestContext,
@@ -15,8 +17,13 @@ from sotkalib.http import (
 	StatusSettings,
 )
 from sotkalib.http.client_session import (
+	MAXIMUM_BACKOFF,
 	HTTPSession,
+	_jittered,
 	_make_ssl_context,
+	_retry_delays,
+	_shared_ssl_context,
+	_socket_factory,
 )
 
 
@@ -39,6 +46,21 @@ def app():
 	async def rate_limit_handler(_):
 		return web.Response(status=429, text="Too Many Requests")
 
+	async def big_rate_limit_handler(_):
+		return web.Response(status=429, text="x" * 100_000)
+
+	flaky_calls = 0
+
+	async def flaky_handler(_):
+		nonlocal flaky_calls
+		flaky_calls += 1
+		if flaky_calls == 1:
+			return web.Response(status=429, text="first-rate-limited")
+		return web.Response(status=500, text="second-error")
+
+	async def nonstandard_status_handler(_):
+		return web.Response(status=599, text="Network Connect Timeout")
+
 	async def echo_headers_handler(request):
 		return web.json_response(dict(request.headers))
 
@@ -55,6 +77,9 @@ def app():
 	application.router.add_get("/not-found", not_found_handler)
 	application.router.add_get("/forbidden", forbidden_handler)
 	application.router.add_get("/rate-limit", rate_limit_handler)
+	application.router.add_get("/big-rate-limit", big_rate_limit_handler)
+	application.router.add_get("/flaky", flaky_handler)
+	application.router.add_get("/nonstandard", nonstandard_status_handler)
 	application.router.add_get("/headers", echo_headers_handler)
 	application.router.add_post("/echo", echo_body_handler)
 
@@ -85,6 +110,45 @@ class TestMakeSslContext:
 		ctx = _make_ssl_context(disable_tls13=True)
 		assert ctx.maximum_version == ssl.TLSVersion.TLSv1_2
 
+	def test_shared_context_is_reused(self):
+		assert _shared_ssl_context() is _shared_ssl_context()
+		assert _shared_ssl_context(True) is not _shared_ssl_context(False)
+
+
+class TestSocketFactory:
+	def test_applies_options(self):
+		factory = _socket_factory(((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),))
+		sock = factory((socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("", 0)))
+		try:
+			assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE) != 0
+		finally:
+			sock.close()
+
+
+class TestRetryDelays:
+	def test_exponential_schedule(self):
+		assert _retry_delays(0.5, 2.0, 4) == (0.5, 1.0, 2.0, 4.0)
+
+	def test_capped_without_overflow(self):
+		delays = _retry_delays(1.0, 2.0, 2000)
+		assert len(delays) == 2000
+		assert delays[-1] == MAXIMUM_BACKOFF
+
+
+class TestJitter:
+	def test_none_keeps_delay(self):
+		assert _jittered("none", 4.0, 1.0, 1.0) == 4.0
+
+	def test_full_within_bounds(self):
+		for _ in range(100):
+			assert 1.0 <= _jittered("full", 4.0, 1.0, 1.0) <= 4.0
+
+	def test_decorrelated_within_bounds(self):
+		previous = 1.0
+		for _ in range(100):
+			previous = _jittered("decorrelated", 4.0, 1.0, previous)
+			assert 1.0 <= previous <= MAXIMUM_BACKOFF
+
 
 class TestClientSettings:
 	def test_defaults(self):
@@ -188,6 +252,13 @@ class TestRequestContext:
 		assert ctx.attempt == 0
 		assert ctx.errors == []
 
+	def test_elapsed_in_seconds(self):
+		ctx = RequestContext(method="GET", url="https://example.com")
+		assert ctx.elapsed is None
+		ctx.started_at = 1_000_000_000
+		ctx.finished_at = 3_500_000_000
+		assert ctx.elapsed == 2.5
+
 	def test_is_retry(self):
 		ctx = RequestContext(method="GET", url="https://example.com")
 		assert ctx.is_retry is False
@@ -275,6 +346,24 @@ class TestClientSession:
 			data = await resp.json()
 			assert data == {"status": "ok"}
 
+	@pytest.mark.asyncio
+	async def test_reopen_does_not_mutate_config(self, base_url):
+		config = ClientSettings()
+		session = HTTPSession(config)
+		for _ in range(2):
+			async with session:
+				resp = await session.get(f"{base_url}/ok")
+				assert resp is not None
+		assert config.session_kwargs == {}
+
+	@pytest.mark.asyncio
+	async def test_socket_options(self, base_url):
+		config = ClientSettings(socket_options=[(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)])
+		async with HTTPSession(config) as session:
+			resp = await session.get(f"{base_url}/ok")
+			assert resp is not None
+			assert resp.status == 200
+
 	@pytest.mark.asyncio
 	async def test_not_found_returns_none(self, base_url):
 		config = ClientSettings(session_kwargs={"connector": aiohttp.TCPConnector(ssl=False)})
@@ -293,6 +382,77 @@ class TestClientSession:
 			with pytest.raises(RanOutOfAttemptsError):
 				await session.get(f"{base_url}/rate-limit")
 
+	@pytest.mark.asyncio
+	async def test_retry_settings_fixed_at_construction(self, base_url):
+		config = ClientSettings(
+			maximum_retries=1,
+			base=0.01,
+			session_kwargs={"connector": aiohttp.TCPConnector(ssl=False)},
+		)
+		async with HTTPSession(config) as session:
+			session.config.maximum_retries = 5
+			with pytest.raises(RanOutOfAttemptsError, match="after 1 retries"):
+				await session.get(f"{base_url}/rate-limit")
+
+	@pytest.mark.asyncio
+	async def test_retry_reads_bounded_body_preview(self, base_url):
+		config = ClientSettings(
+			maximum_retries=1,
+			base=0.01,
+			status_settings=StatusSettings(error_body_preview_bytes=16),
+			session_kwargs={"connector": aiohttp.TCPConnector(ssl=False)},
+		)
+		async with HTTPSession(config) as session:
+			with pytest.raises(RanOutOfAttemptsError) as exc_info:
+				await session.get(f"{base_url}/big-rate-limit")
+		cause = exc_info.value.__cause__
+		assert isinstance(cause, StatusRetryError)
+		assert cause.context == "x" * 16
+
+	@pytest.mark.asyncio
+	async def test_raise_reads_body_of_current_attempt(self, base_url):
+		config = ClientSettings(
+			maximum_retries=1,
+			base=0.01,
+			status_settings=StatusSettings(to_raise={500}, to_retry={429}),
+			exception_settings=ExceptionSettings(to_raise=(CriticalStatusError,)),
+			session_kwargs={"connector": aiohttp.TCPConnector(ssl=False)},
+		)
+		async with HTTPSession(config) as session:
+			with pytest.raises(CriticalStatusError) as exc_info:
+				await session.get(f"{base_url}/flaky")
+		assert "second-error" in str(exc_info.value)
+		assert "first-rate-limited" not in str(exc_info.value)
+
+	@pytest.mark.asyncio
+	async def test_nonstandard_status_passes_through(self, base_url):
+		config = ClientSettings(session_kwargs={"connector": aiohttp.TCPConnector(ssl=False)})
+		async with HTTPSession(config) as session:
+			resp = await session.get(f"{base_url}/nonstandard")
+			assert resp is not None
+			assert resp.status == 599
+
+	@pytest.mark.asyncio
+	async def test_static_useragent_resolved_once(self, base_url):
+		calls = []
+
+		def factory():
+			calls.append(1)
+			return "StaticBot/1.0"
+
+		config = ClientSettings(
+			useragent_factory=factory,
+			useragent_static=True,
+			session_kwargs={"connector": aiohttp.TCPConnector(ssl=False)},
+		)
+		async with HTTPSession(config) as session:
+			for _ in range(2):
+				resp = await session.get(f"{base_url}/headers")
+				# pyrefly: ignore [missing-attribute]
+				data = await resp.json()
+				assert data["User-Agent"] == "StaticBot/1.0"
+		assert len(calls) == 1
+
 	@pytest.mark.asyncio
 	async def test_useragent_factory(self, base_url):
 		config = ClientSettings(
@@ -3,11 +3,14 @@ from http import HTTPStatus
 import pytest
 from aiohttp import client_exceptions
 
+from sotkalib.http.context import RequestContext
 from sotkalib.http.models import (
 	ClientSettings,
 	ExceptionSettings,
 	StatusSettings,
 	_MergeableSettings,
+	default_exc_arg_func,
+	default_stat_arg_func,
 )
 
 
@@ -232,6 +235,21 @@ class TestMergeableSettingsInternals:
 		_ = base._merge_from(patch)
 		assert base.not_found_as_none is True
 
+	def test_merge_copies_containers_but_shares_values(self):
+		marker = object()
+		base = ClientSettings(session_kwargs={"connector": marker})
+		result = base | ClientSettings(timeout=1.0)
+		assert result.session_kwargs is not base.session_kwargs
+		assert result.session_kwargs["connector"] is marker
+		result.status_settings.to_raise.add(HTTPStatus.NOT_FOUND)
+		assert HTTPStatus.NOT_FOUND not in base.status_settings.to_raise
+
+	def test_merged_result_keeps_patch_fields_set(self):
+		merged = StatusSettings(not_found_as_none=False) | StatusSettings(unspecified="raise")
+		result = StatusSettings(not_found_as_none=True, unspecified="retry") | merged
+		assert result.not_found_as_none is False
+		assert result.unspecified == "raise"
+
 	def test_model_fields_set_tracking(self):
 		# Pydantic tracks which fields were explicitly set
 		s = StatusSettings(not_found_as_none=False)
@@ -273,3 +291,19 @@ class TestDeprecatedWithMethod:
 		with pytest.warns(DeprecationWarning):
 			_ = base.with_(timeout=30.0)
 		assert base.timeout == 10.0
+
+
+class TestDefaultArgFuncs:
+	@pytest.mark.asyncio
+	async def test_exc_arg_func_returns_single_message(self):
+		ctx = RequestContext(method="GET", url="https://example.com")
+		ctx.last_error = ValueError("boom")
+		args, kwargs = await default_exc_arg_func(ctx)
+		assert len(args) == 1
+		assert "boom" in args[0]
+		assert kwargs == {}
+
+	@pytest.mark.asyncio
+	async def test_stat_arg_func_without_response(self):
+		ctx = RequestContext(method="GET", url="https://example.com")
+		assert await default_stat_arg_func(ctx) == ((), {})
@@ -0,0 +1,77 @@
+from datetime import UTC, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import NamedTuple
+from uuid import UUID
+
+import orjson
+from pydantic import BaseModel
+
+from sotkalib.json import safe_serialize, safe_serialize_value
+
+
+class Color(Enum):
+	RED = "red"
+
+
+class Point(BaseModel):
+	x: int
+	y: int
+
+
+class Pair(NamedTuple):
+	left: int
+	right: str
+
+
+class Plain:
+	def __init__(self):
+		self.name = "plain"
+		self.tags = {"a"}
+
+
+class TestSafeSerialize:
+	def test_matches_python_walk(self):
+		data = {
+			"when": datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=UTC),
+			"amount": Decimal("1.5"),
+			"id": UUID("12345678-1234-5678-1234-567812345678"),
+			"color": Color.RED,
+			"raw": b"bytes",
+			"point": Point(x=1, y=2),
+			"plain": Plain(),
+			"nested": [(1, 2), {"k": None}],
+		}
+		assert safe_serialize(data) == orjson.dumps(safe_serialize_value(data))
+
+	def test_namedtuple_as_list(self):
+		data = {"pair": Pair(1, "a"), "pairs": [Pair(2, "b")]}
+		assert orjson.loads(safe_serialize(data)) == {"pair": [1, "a"], "pairs": [[2, "b"]]}
+		assert safe_serialize(data) == orjson.dumps(safe_serialize_value(data))
+
+	def test_non_str_keys(self):
+		assert orjson.loads(safe_serialize({1: "a"})) == {"1": "a"}
+
+	def test_circular_reference_falls_back(self):
+		obj = Plain()
+		obj.self = obj  # pyrefly: ignore [missing-attribute]
+		loaded = orjson.loads(safe_serialize(obj))
+		assert loaded["name"] == "plain"
+
+
+class TestSafeSerializeValue:
+	def test_exact_types(self):
+		value = {"a": [1, (2, 3)], "d": Decimal("1.5"), "b": b"hi", "n": None}
+		assert safe_serialize_value(value) == {"a": [1, [2, 3]], "d": 1.5, "b": "hi", "n": None}
+
+	def test_subclasses_take_isinstance_path(self):
+		class Tag(str):
+			pass
+
+		class Rows(list):
+			pass
+
+		assert safe_serialize_value(Rows([Tag("x"), Color.RED])) == ["x", "red"]
+
+	def test_depth_limit(self):
+		assert safe_serialize_value([[1]], _depth_limit=0) == ["[1]"]
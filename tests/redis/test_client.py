@@ -14,6 +14,15 @@ async def test_redis_pool_default_settings(redis_url: str):
 		assert result == "test_value"
 
 
+@pytest.mark.asyncio
+async def test_redis_pool_shares_connection_pool():
+	settings = RedisPoolSettings(uri="redis://localhost:6379", db_num=3)
+	assert (
+		RedisPool(settings)._pool is RedisPool(RedisPoolSettings(uri=settings.uri, db_num=3))._pool
+	)
+	assert RedisPool(settings)._pool is not RedisPool(RedisPoolSettings(db_num=2))._pool
+
+
 @pytest.mark.asyncio
 async def test_redis_pool_no_settings():
 	pool = RedisPool()
@@ -1,5 +1,6 @@
 import asyncio
 import contextlib
+import gc
 
 import pytest
 from redis.asyncio import Redis
@@ -289,6 +290,24 @@ async def test_released_on_exception(redis_url: str, redis_client: Redis):
 	assert val is None
 
 
+@pytest.mark.asyncio
+async def test_suppressing_factory_does_not_swallow_body_error(redis_url: str):
+	pool = RedisPool(RedisPoolSettings(uri=redis_url, db_num=0))
+
+	class SuppressingFactory:
+		async def __aenter__(self) -> Redis:
+			return await pool.__aenter__()
+
+		async def __aexit__(self, *exc_info) -> bool:
+			await pool.__aexit__(*exc_info)
+			return True
+
+	lock = DistributedLock(SuppressingFactory())
+	with pytest.raises(ValueError, match="boom"):
+		async with lock.acq("test:locker:suppressing_factory"):
+			raise ValueError("boom")
+
+
 # ── exc builder ───────────────────────────────────────────────────
 
 
@@ -522,6 +541,16 @@ async def test_extend_disabled_ttl_expires(redis_url: str, redis_client: Redis):
 		assert val is None  # TTL expired, no watchdog to extend
 
 
+@pytest.mark.asyncio
+async def test_fractional_ttl_uses_milliseconds(redis_url: str, redis_client: Redis):
+	pool = RedisPool(RedisPoolSettings(uri=redis_url, db_num=0))
+	lock = DistributedLock(pool).extend(enabled=False)
+	key = "test:locker:fractional_ttl"
+
+	async with lock.acquire(key, ttl=0.5):
+		assert 0 < await redis_client.pttl(key) <= 500
+
+
 @pytest.mark.asyncio
 async def test_watchdog_stops_on_release(redis_url: str, redis_client: Redis):
 	pool = RedisPool(RedisPoolSettings(uri=redis_url, db_num=0))
@@ -540,7 +569,73 @@ async def test_watchdog_stops_on_release(redis_url: str, redis_client: Redis):
 	for task in asyncio.all_tasks():
 		coro = task.get_coro()
 		if coro is not None and hasattr(coro, "__qualname__"):
-			assert "DistributedLock._watchdog" not in coro.__qualname__
+			assert "_WatchdogRegistry._run" not in coro.__qualname__
+
+
+@pytest.mark.asyncio
+async def test_watchdog_shared_across_locks(redis_url: str, redis_client: Redis):
+	pool = RedisPool(RedisPoolSettings(uri=redis_url, db_num=0))
+	lock = DistributedLock(pool)
+
+	def watchdog_tasks() -> int:
+		return sum(
+			1
+			for task in asyncio.all_tasks()
+			if "_WatchdogRegistry._run" in getattr(task.get_coro(), "__qualname__", "")
+		)
+
+	async with (
+		lock.acquire("test:locker:watchdog_a", ttl=2),
+		lock.acquire("test:locker:watchdog_b", ttl=2),
+	):
+		# both locks ride on one pipelined extender
+		assert watchdog_tasks() == 1
+		await asyncio.sleep(3)
+		assert await redis_client.get("test:locker:watchdog_a") is not None
+		assert await redis_client.get("test:locker:watchdog_b") is not None
+
+
+def test_watchdog_survives_new_event_loop(redis_url: str):
+	# one pool (and so one client) used under two event loops, like consecutive asyncio.run calls
+	pool = RedisPool(RedisPoolSettings(uri=redis_url, db_num=0))
+	lock = DistributedLock(pool)
+	key = "test:locker:watchdog_loops"
+
+	async def held_past_ttl() -> bool:
+		rc = await pool.__aenter__()
+		try:
+			async with lock.acquire(key, ttl=1):
+				await asyncio.sleep(1.5)
+				return bool(await rc.exists(key))
+		finally:
+			# the connections were opened on this loop; don't hand them to the next one
+			await rc.connection_pool.disconnect()
+
+	assert asyncio.run(held_past_ttl())
+	assert asyncio.run(held_past_ttl())
+
+
+@pytest.mark.asyncio
+async def test_watchdog_registry_dies_with_client(redis_url: str):
+	class FreshClientFactory:
+		# a new client per lock, like a factory that doesn't pool its clients
+		async def __aenter__(self) -> Redis:
+			self._rc = Redis.from_url(redis_url)
+			return self._rc
+
+		async def __aexit__(self, *exc_info) -> None:
+			await self._rc.aclose()
+			del self._rc
+
+	before = len(DistributedLock._watchdogs)
+	lock = DistributedLock(FreshClientFactory())
+	for i in range(3):
+		async with lock.acquire(f"test:locker:watchdog_gc_{i}", ttl=1):
+			pass
+
+	await asyncio.sleep(0.1)
+	gc.collect()
+	assert len(DistributedLock._watchdogs) == before
 
 
 # ── extend builder ────────────────────────────────────────────────
@@ -567,3 +662,8 @@ def test_extend_builder_chains(redis_url: str):
 def test_dl_settings_extend_ttl_default():
 	settings = DLSettings()
 	assert settings.extend_ttl is True
+
+
+def test_dl_settings_rejects_low_watchdog_factor():
+	with pytest.raises(ValueError, match="watchdog_factor"):
+		DLSettings(watchdog_factor=0.5)
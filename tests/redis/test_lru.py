@@ -1,9 +1,12 @@
+import asyncio
+
 import pytest
 from redis.asyncio import Redis
 
-from sotkalib.redis.lru import LRUSettings, RedisLRU
+from sotkalib.redis.lru import CachedFailureError, LRUSettings, RedisLRU
+from sotkalib.redis.lru.settings import base_keyfunc
 from sotkalib.redis.pool import RedisPool, RedisPoolSettings
-from sotkalib.serializer.impl.pickle import B64Pickle, SecurityWarning
+from sotkalib.serializer.impl.pickle import B64Pickle, RawPickle, SecurityWarning
 from sotkalib.type.generics import strlike
 
 
@@ -67,6 +70,95 @@ async def test_lru_different_args_different_cache(redis_url: str):
 	assert call_count == 2  # Different args, so function was called again
 
 
+@pytest.mark.asyncio
+async def test_lru_coalesces_concurrent_misses(redis_url: str):
+	"""Concurrent callers with the same key share one function execution."""
+	settings = RedisPoolSettings(uri=redis_url, db_num=0)
+	pool = RedisPool(settings)
+
+	call_count = 0
+
+	def deterministic_keyfunc(version: int, func_name: str, *args, **_kwargs) -> str:
+		return f"coalesce:{version}:{func_name}:{args}"
+
+	lru = RedisLRU(pool).keyfunc(deterministic_keyfunc)
+
+	@lru
+	async def slow_double(x: int) -> int:
+		nonlocal call_count
+		call_count += 1
+		await asyncio.sleep(0.1)
+		return x * 2
+
+	with pytest.warns(SecurityWarning):
+		results = await asyncio.gather(*(slow_double(4) for _ in range(5)))
+	assert results == [8] * 5
+	assert call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_cancelled_leader_hands_over(redis_url: str):
+	"""A waiter retries the call when the caller it was waiting on is cancelled."""
+	settings = RedisPoolSettings(uri=redis_url, db_num=0)
+	pool = RedisPool(settings)
+
+	call_count = 0
+
+	def deterministic_keyfunc(version: int, func_name: str, *args, **_kwargs) -> str:
+		return f"handover:{version}:{func_name}:{args}"
+
+	lru = RedisLRU(pool).keyfunc(deterministic_keyfunc)
+
+	@lru
+	async def slow_triple(x: int) -> int:
+		nonlocal call_count
+		call_count += 1
+		await asyncio.sleep(0.1)
+		return x * 3
+
+	leader = asyncio.create_task(slow_triple(7))
+	await asyncio.sleep(0.05)
+	follower = asyncio.create_task(slow_triple(7))
+	await asyncio.sleep(0)
+	leader.cancel()
+
+	with pytest.warns(SecurityWarning):
+		assert await follower == 21
+	assert leader.cancelled()
+	assert call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_lru_error_ttl_caches_failure(redis_url: str):
+	"""With error_ttl set, a failed call is not retried until the failure expires."""
+	settings = RedisPoolSettings(uri=redis_url, db_num=0)
+	pool = RedisPool(settings)
+
+	call_count = 0
+
+	def deterministic_keyfunc(version: int, func_name: str, *args, **_kwargs) -> str:
+		return f"negative:{version}:{func_name}:{args}"
+
+	lru = RedisLRU(pool).keyfunc(deterministic_keyfunc).error_ttl(1)
+
+	@lru
+	async def flaky() -> int:
+		nonlocal call_count
+		call_count += 1
+		raise RuntimeError("upstream down")
+
+	with pytest.raises(RuntimeError, match="upstream down"):
+		await flaky()
+	with pytest.raises(CachedFailureError):
+		await flaky()
+	assert call_count == 1
+
+	await asyncio.sleep(1.5)
+	with pytest.raises(RuntimeError, match="upstream down"):
+		await flaky()
+	assert call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_lru_with_ttl(redis_url: str, redis_client: Redis):
 	"""Cache entries expire after TTL."""
@@ -86,7 +178,7 @@ async def test_lru_with_ttl(redis_url: str, redis_client: Redis):
 		await get_value()
 
 	# Verify TTL was set on the cache key
-	key = "ttl_test:1:get_value:()"
+	key = f"ttl_test:1:{get_value.__module__}.{get_value.__qualname__}:()"
 	ttl = await redis_client.ttl(key)
 	assert ttl > 0
 	assert ttl <= 60
@@ -309,9 +401,53 @@ def test_b64pickle_handles_various_types():
 		assert unmarshaled == original
 
 
+def test_raw_pickle_marshal_unmarshal():
+	"""RawPickle round-trips data without base64 framing."""
+	original = {"nested": [1, 2, 3], "key": b"\xff\x00"}
+	with pytest.warns(SecurityWarning):
+		marshaled = RawPickle.marshal(original)
+		framed = B64Pickle.marshal(original)
+	assert len(marshaled) < len(framed)
+
+	assert RawPickle.unmarshal(marshaled) == original
+
+
 def test_lru_settings_defaults():
 	"""LRUSettings has correct defaults."""
 	settings = LRUSettings()
 	assert settings.version == 1
 	assert settings.ttl == 600
 	assert settings.serializer is B64Pickle
+
+
+def test_base_keyfunc_is_deterministic():
+	"""Same call arguments map to the same key regardless of keyword order."""
+	key = base_keyfunc(1, "f", 1, "a", x=1, y=[2])
+	assert key == base_keyfunc(1, "f", 1, "a", y=[2], x=1)
+	assert key.startswith("1_f_")
+	assert len(key.rsplit("_", 1)[1]) == 32
+
+
+def test_base_keyfunc_distinguishes_calls():
+	"""Different versions, names or arguments map to different keys."""
+	key = base_keyfunc(1, "f", 1)
+	assert key != base_keyfunc(2, "f", 1)
+	assert key != base_keyfunc(1, "g", 1)
+	assert key != base_keyfunc(1, "f", 2)
+	assert key != base_keyfunc(1, "f", x=1)
+	assert base_keyfunc(1, "f", {1}) != base_keyfunc(1, "f", [1])
+	assert base_keyfunc(1, "f", {1}) != base_keyfunc(1, "f", frozenset({1}))
+
+
+def test_base_keyfunc_ignores_set_and_dict_order():
+	"""Equal sets and dicts map to the same key whatever their iteration order."""
+	words = {f"w{i}" for i in range(50)}
+	# same members, but a grown-then-shrunk table iterates them in another order
+	resized = set(range(1000)) | words
+	resized -= set(range(1000))
+	assert list(words) != list(resized)
+	assert base_keyfunc(1, "f", words) == base_keyfunc(1, "f", resized)
+	assert base_keyfunc(1, "f", {"a", 1, None}) == base_keyfunc(1, "f", {None, 1, "a"})
+	assert base_keyfunc(1, "f", opts={"a": 1, "b": {2, 3}}) == base_keyfunc(
+		1, "f", opts={"b": {3, 2}, "a": 1}
+	)
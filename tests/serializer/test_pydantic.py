@@ -0,0 +1,33 @@
+import pytest
+from pydantic import BaseModel, ValidationError, computed_field
+
+from sotkalib.serializer.impl.pydantic import PydanticSerializer
+
+
+class User(BaseModel):
+	name: str
+	age: int = 0
+	tags: list[str] = []
+
+	@computed_field
+	@property
+	def label(self) -> str:
+		return f"{self.name}:{self.age}"
+
+
+class TestPydanticSerializer:
+	def test_round_trip(self):
+		szr = PydanticSerializer[User]()
+		user = User(name="a", age=3, tags=["x"])
+		assert szr.unmarshal(szr.marshal(user)) == user
+
+	def test_defaults_are_omitted_and_restored(self):
+		szr = PydanticSerializer[User]()
+		raw = szr.marshal(User(name="a"))
+		assert raw == b'{"name":"a"}'
+		assert szr.unmarshal(raw) == User(name="a")
+
+	def test_unmarshal_validates(self):
+		szr = PydanticSerializer[User]()
+		with pytest.raises(ValidationError):
+			szr.unmarshal(b'{"age":"old"}')